@@ -0,0 +1,194 @@
+import itertools
+import numpy as np
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from api.cache import get_or_compute
+from api.models import Stats
+
+
+ADVANCED_METRICS = [
+    'true_shooting_percentage',
+    'effective_field_goal_percentage',
+    'assist_to_turnover_ratio',
+    'usage_rate',
+    'player_efficiency_rating',
+]
+LEAGUE_AVERAGE_PER = 15.0
+STATLINE_COLUMNS = ['player_id', 'player_team', 'game_id', *Stats.STAT_FIELDS]
+FGM, FGA, TPM, TPA, FTM, FTA, ORB, DRB, AST, STL, BLK, TOV = range(len(Stats.STAT_FIELDS))
+
+
+def get_counted_statlines():
+    return Stats.objects.filter(Q(player__team=F('game__home_team')) | Q(player__team=F('game__away_team')))
+
+
+def get_stat_sums(prefix='', **extra):
+    return {field: Coalesce(Sum(f'{prefix}{field}', **extra), 0) for field in Stats.STAT_FIELDS}
+
+
+def to_array(rows):
+    return np.array([[row[field] for field in Stats.STAT_FIELDS] for row in rows], dtype=float).reshape(
+        -1,
+        len(Stats.STAT_FIELDS),
+    )
+
+
+def load_statlines():
+    rows = get_counted_statlines().annotate(player_team=F('player__team')).order_by().values_list(*STATLINE_COLUMNS)
+    values = np.fromiter(itertools.chain.from_iterable(rows.iterator(chunk_size=5000)), dtype=np.int64)
+    return values.reshape(-1, len(STATLINE_COLUMNS))
+
+
+def load_league_totals():
+    totals = get_counted_statlines().aggregate(
+        **get_stat_sums(),
+        home_team_games=Count('game', distinct=True, filter=Q(player__team=F('game__home_team'))),
+        away_team_games=Count('game', distinct=True, filter=Q(player__team=F('game__away_team'))),
+    )
+    league = to_array([totals])[0]
+    return league, divide(get_possessions(league), totals['home_team_games'] + totals['away_team_games'])
+
+
+def load_player_totals(player_id):
+    statlines = get_counted_statlines().filter(player_id=player_id).annotate(player_team=F('player__team'))
+    player_rows = list(statlines.values('player_team', 'game_id', *Stats.STAT_FIELDS))
+    team_games = {(row['player_team'], row['game_id']) for row in player_rows}
+    team_rows = get_counted_statlines().filter(game__in=[game_id for _, game_id in team_games]).values(
+        'player__team',
+        'game',
+    ).annotate(**get_stat_sums()).order_by()
+    team_rows = [row for row in team_rows if (row['player__team'], row['game']) in team_games]
+    return len(player_rows), to_array(player_rows).sum(axis=0), to_array(team_rows).sum(axis=0)
+
+
+def load_league_adjusted_per(league, league_pace):
+    statlines = get_counted_statlines().values('player').order_by('player')
+    player_rows = list(statlines.annotate(games_played=Count('pk'), **get_stat_sums()))
+    team_rows = statlines.annotate(
+        **get_stat_sums('game__stats__', filter=Q(game__stats__player__team=F('player__team'))),
+    )
+    games_played = np.array([row['games_played'] for row in player_rows], dtype=float)
+    return get_league_adjusted_per(to_array(player_rows), to_array(team_rows), league, games_played, league_pace)
+
+
+def divide(numerator, denominator):
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, float), np.asarray(denominator, float))
+    return np.divide(numerator, denominator, out=np.zeros(numerator.shape), where=denominator != 0)
+
+
+def sum_by(index, values, size):
+    totals = np.zeros((size, values.shape[1]))
+    np.add.at(totals, index, values)
+    return totals
+
+
+def get_points(stats):
+    return 2 * stats[..., FGM] + stats[..., TPM] + stats[..., FTM]
+
+
+def get_possessions(stats):
+    return stats[..., FGA] - stats[..., ORB] + stats[..., TOV] + 0.44 * stats[..., FTA]
+
+
+def get_plays(stats):
+    return stats[..., FGA] + 0.44 * stats[..., FTA] + stats[..., TOV]
+
+
+def get_unadjusted_per(player, team, league, games_played):
+    factor = 2 / 3 - divide(0.5 * divide(league[AST], league[FGM]), 2 * divide(league[FGM], league[FTM]))
+    value_of_possession = divide(get_points(league), get_possessions(league))
+    defensive_rebound_share = divide(league[DRB], league[ORB] + league[DRB])
+    team_assist_ratio = divide(team[:, AST], team[:, FGM])
+
+    contributions = (
+        player[:, TPM]
+        + 2 / 3 * player[:, AST]
+        + (2 - factor * team_assist_ratio) * player[:, FGM]
+        + player[:, FTM] * 0.5 * (1 + (1 - team_assist_ratio) + 2 / 3 * team_assist_ratio)
+        - value_of_possession * player[:, TOV]
+        - value_of_possession * defensive_rebound_share * (player[:, FGA] - player[:, FGM])
+        - value_of_possession * 0.44 * (0.44 + 0.56 * defensive_rebound_share) * (player[:, FTA] - player[:, FTM])
+        + value_of_possession * (1 - defensive_rebound_share) * player[:, DRB]
+        + value_of_possession * defensive_rebound_share * player[:, ORB]
+        + value_of_possession * player[:, STL]
+        + value_of_possession * defensive_rebound_share * player[:, BLK]
+    )
+    return divide(contributions, games_played)
+
+
+def get_adjusted_per(player, team, league, games_played, league_pace):
+    unadjusted_per = get_unadjusted_per(player, team, league, games_played)
+    team_pace = divide(get_possessions(team), games_played)
+    return divide(league_pace, team_pace) * unadjusted_per
+
+
+def get_league_adjusted_per(player, team, league, games_played, league_pace):
+    adjusted_per = get_adjusted_per(player, team, league, games_played, league_pace)
+    return divide((adjusted_per * games_played).sum(), games_played.sum())
+
+
+def get_metrics(player, team, league, games_played, league_pace, league_adjusted_per):
+    adjusted_per = get_adjusted_per(player, team, league, games_played, league_pace)
+    metrics = {
+        'true_shooting_percentage': 100 * divide(get_points(player), 2 * (player[:, FGA] + 0.44 * player[:, FTA])),
+        'effective_field_goal_percentage': 100 * divide(player[:, FGM] + 0.5 * player[:, TPM], player[:, FGA]),
+        'assist_to_turnover_ratio': divide(player[:, AST], player[:, TOV]),
+        'usage_rate': 100 * divide(get_plays(player), get_plays(team)),
+        'player_efficiency_rating': adjusted_per * divide(LEAGUE_AVERAGE_PER, league_adjusted_per),
+    }
+    return {name: np.round(values, 2).tolist() for name, values in metrics.items()}
+
+
+def compute_advanced_metrics(statlines):
+    if not len(statlines):
+        return {}
+
+    player_ids, player_index = np.unique(statlines[:, 0], return_inverse=True)
+    _, team_game_index = np.unique(statlines[:, 1:3], axis=0, return_inverse=True)
+    player_index, team_game_index = player_index.reshape(-1), team_game_index.reshape(-1)
+    stats = statlines[:, 3:].astype(float)
+
+    team_games = sum_by(team_game_index, stats, team_game_index.max() + 1)
+    player = sum_by(player_index, stats, len(player_ids))
+    team = sum_by(player_index, team_games[team_game_index], len(player_ids))
+    league = stats.sum(axis=0)
+    games_played = np.bincount(player_index)
+
+    league_pace = get_possessions(team_games).mean()
+    league_adjusted_per = get_league_adjusted_per(player, team, league, games_played, league_pace)
+    rounded_metrics = get_metrics(player, team, league, games_played, league_pace, league_adjusted_per)
+
+    return {
+        player_id: {
+            'player_id': player_id,
+            'games_played': player_games,
+            **{name: values[index] for name, values in rounded_metrics.items()},
+        }
+        for index, (player_id, player_games) in enumerate(zip(player_ids.tolist(), games_played.tolist()))
+    }
+
+
+def get_advanced_metrics():
+    return get_or_compute('advanced-metrics', lambda: compute_advanced_metrics(load_statlines()))
+
+
+def compute_player_advanced_metrics(player_id):
+    games_played, player, team = load_player_totals(player_id)
+    if not games_played:
+        return {'player_id': player_id, 'games_played': 0, **{name: 0.0 for name in ADVANCED_METRICS}}
+
+    league, league_pace = load_league_totals()
+    league_adjusted_per = get_or_compute(
+        'advanced-metrics:league-adjusted-per',
+        lambda: load_league_adjusted_per(league, league_pace),
+    )
+    metrics = get_metrics(player[None], team[None], league, np.array([games_played]), league_pace, league_adjusted_per)
+    return {
+        'player_id': player_id,
+        'games_played': games_played,
+        **{name: values[0] for name, values in metrics.items()},
+    }
+
+
+def get_player_advanced_metrics(player_id):
+    return get_or_compute(f'advanced-metrics:player:{player_id}', lambda: compute_player_advanced_metrics(player_id))
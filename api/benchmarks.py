@@ -0,0 +1,288 @@
+import datetime
+import math
+import random
+import statistics
+import time
+import tracemalloc
+from django.core.cache import cache
+from django.core.signals import request_finished
+from django.db import connection, transaction
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from api.models import Team, Coach, Player, Game, Stats, PlayerAverages
+
+
+SEASON_START = datetime.datetime(2023, 10, 24, 19, 0, tzinfo=datetime.timezone.utc)
+
+CONNECTION_MODES = {
+    'per_request': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+    'persistent': {'CONN_MAX_AGE': None, 'CONN_HEALTH_CHECKS': True},
+}
+
+
+def random_statline(rng):
+    field_goals_attempted = rng.randint(0, 22)
+    field_goals_made = rng.randint(0, field_goals_attempted)
+    three_pointers_attempted = rng.randint(0, field_goals_attempted)
+    three_pointers_made = rng.randint(0, min(three_pointers_attempted, field_goals_made))
+    free_throws_attempted = rng.randint(0, 10)
+    return {
+        'field_goals_made': field_goals_made,
+        'field_goals_attempted': field_goals_attempted,
+        'three_pointers_made': three_pointers_made,
+        'three_pointers_attempted': three_pointers_attempted,
+        'free_throws_made': rng.randint(0, free_throws_attempted),
+        'free_throws_attempted': free_throws_attempted,
+        'offensive_rebounds': rng.randint(0, 5),
+        'defensive_rebounds': rng.randint(0, 10),
+        'assists': rng.randint(0, 10),
+        'steals': rng.randint(0, 3),
+        'blocks': rng.randint(0, 3),
+        'turnovers': rng.randint(0, 5),
+    }
+
+
+def get_schedule(team_count, games_per_team):
+    rotation = list(range(1, team_count))
+    for round_number in range(games_per_team):
+        cycle, base_round = divmod(round_number, team_count - 1)
+        rotated = [0, *rotation[base_round:], *rotation[:base_round]]
+        for pair_index in range(team_count // 2):
+            home, away = rotated[pair_index], rotated[team_count - 1 - pair_index]
+            if (cycle + base_round + pair_index) % 2:
+                home, away = away, home
+            yield round_number, home, away
+
+
+def seed_league(seed=0, team_count=30, players_per_team=15, games_per_team=82, players_per_game=12):
+    rng = random.Random(seed)
+    letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+    teams = Team.objects.bulk_create(
+        Team(
+            name_abbreviation=f'{letters[index // 26]}{letters[index % 26]}{letters[(index * 7) % 26]}',
+            full_name=f'Benchmark Team {index + 1}',
+        )
+        for index in range(team_count)
+    )
+    Coach.objects.bulk_create(
+        Coach(name=f'Coach {team.full_name}', date_of_birth=datetime.date(1970, 1, 1), team=team)
+        for team in teams
+    )
+
+    players = []
+    for team in teams:
+        for jersey_number in rng.sample(range(100), players_per_team):
+            players.append(Player(
+                name=f'Player {len(players) + 1}',
+                team=team,
+                date_of_birth=datetime.date(rng.randint(1985, 2004), rng.randint(1, 12), rng.randint(1, 28)),
+                country='USA',
+                position=rng.choice(Player.POSITION_CHOICES)[0],
+                height=rng.randint(180, 225),
+                weight=rng.randint(75, 130),
+                jersey_number=jersey_number,
+            ))
+    players = Player.objects.bulk_create(players)
+    rosters = {team.pk: [player for player in players if player.team_id == team.pk] for team in teams}
+
+    games = Game.objects.bulk_create(
+        Game(
+            date=SEASON_START + datetime.timedelta(days=round_number),
+            home_team=teams[home],
+            away_team=teams[away],
+        )
+        for round_number, home, away in get_schedule(team_count, games_per_team)
+    )
+
+    statlines = (
+        Stats(game=game, player=player, **random_statline(rng))
+        for game in games
+        for team_id in (game.home_team_id, game.away_team_id)
+        for player in rng.sample(rosters[team_id], players_per_game)
+    )
+    Stats.objects.bulk_create(statlines, batch_size=2000)
+
+    PlayerAverages.rebuild([player.pk for player in players])
+    Game.objects.filter(pk__in=[game.pk for game in games]).refresh_scores()
+
+    return {
+        'teams': len(teams),
+        'players': len(players),
+        'games': len(games),
+        'stats': Stats.objects.count(),
+    }
+
+
+def delete_league():
+    tables = {
+        'team': Team._meta.db_table,
+        'coach': Coach._meta.db_table,
+        'player': Player._meta.db_table,
+        'game': Game._meta.db_table,
+        'stats': Stats._meta.db_table,
+        'averages': PlayerAverages._meta.db_table,
+    }
+    statements = [
+        'DELETE FROM {stats} WHERE game_id IN (SELECT id FROM {game})',
+        'DELETE FROM {averages} WHERE player_id IN (SELECT id FROM {player} WHERE team_id IS NOT NULL)',
+        'DELETE FROM {game}',
+        'DELETE FROM {player} WHERE team_id IS NOT NULL',
+        'DELETE FROM {coach} WHERE team_id IS NOT NULL',
+        'DELETE FROM {team}',
+    ]
+    with transaction.atomic(), connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement.format(**tables))
+
+
+def get_url_patterns(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from get_url_patterns(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            yield pattern
+
+
+def get_benchmark_endpoints(urlpatterns):
+    samples = get_benchmark_samples()
+    endpoints = {}
+
+    for pattern in get_url_patterns(urlpatterns):
+        actions = getattr(pattern.callback, 'actions', None)
+        url_kwargs = set(pattern.pattern.regex.groupindex)
+        if not pattern.name or not actions or 'get' not in actions or 'format' in url_kwargs:
+            continue
+
+        kwargs = {}
+        for url_kwarg in url_kwargs:
+            if url_kwarg == 'pk':
+                model_name = pattern.callback.cls.queryset.model._meta.model_name
+            else:
+                model_name = url_kwarg.removesuffix('_pk')
+            kwargs[url_kwarg] = samples[model_name].pk
+
+        endpoints[pattern.name] = reverse(pattern.name, kwargs=kwargs)
+
+    return endpoints
+
+
+def get_benchmark_samples():
+    statline = Stats.objects.select_related('player__team', 'game').order_by('pk')[Stats.objects.count() // 2]
+    team = statline.player.team
+    return {
+        'team': team,
+        'coach': team.coach.order_by('pk').first(),
+        'player': statline.player,
+        'game': statline.game,
+        'stats': statline,
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def benchmark_endpoint(client, url, iterations, warmup, cold_cache):
+    for _ in range(warmup):
+        client.get(url)
+
+    latencies = []
+    for _ in range(iterations):
+        if cold_cache:
+            cache.clear()
+        started = time.perf_counter()
+        response = client.get(url)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f'{url} returned {response.status_code}.')
+
+    if cold_cache:
+        cache.clear()
+    tracemalloc.start()
+    with CaptureQueriesContext(connection) as queries:
+        client.get(url)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'url': url,
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'mean_ms': round(statistics.mean(latencies), 3),
+        'queries': len(queries),
+        'peak_memory_kb': round(peak_memory / 1024, 1),
+    }
+
+
+def run_benchmarks(endpoints, iterations=20, warmup=2, cold_cache=True):
+    client = Client()
+    return {
+        name: benchmark_endpoint(client, url, iterations, warmup, cold_cache)
+        for name, url in sorted(endpoints.items())
+    }
+
+
+def benchmark_connection_mode(client, url, iterations, connection_settings):
+    opened_connections = []
+
+    def count_connection(sender, connection, **kwargs):
+        opened_connections.append(connection.alias)
+
+    original_settings = {key: connection.settings_dict[key] for key in connection_settings}
+    connection.close()
+    connection.settings_dict.update(connection_settings)
+    connection_created.connect(count_connection)
+
+    latencies = []
+    try:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = client.get(url)
+            request_finished.send(sender=benchmark_connection_mode)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f'{url} returned {response.status_code}.')
+    finally:
+        connection_created.disconnect(count_connection)
+        connection.close()
+        connection.settings_dict.update(original_settings)
+
+    return {
+        'url': url,
+        'p50_ms': round(percentile(latencies, 0.5), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'connections_opened': len(opened_connections),
+    }
+
+
+def run_connection_benchmarks(url, iterations=100):
+    client = Client()
+    return {
+        mode: benchmark_connection_mode(client, url, iterations, connection_settings)
+        for mode, connection_settings in CONNECTION_MODES.items()
+    }
+
+
+def compare_with_baseline(results, baseline, threshold):
+    regressions = []
+
+    for name, result in results.items():
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            continue
+
+        if result['p50_ms'] > baseline_result['p50_ms'] * (1 + threshold):
+            regressions.append(f'{name}: p50 {baseline_result["p50_ms"]} ms -> {result["p50_ms"]} ms')
+        if result['queries'] > baseline_result['queries']:
+            regressions.append(f'{name}: queries {baseline_result["queries"]} -> {result["queries"]}')
+        if result['peak_memory_kb'] > baseline_result['peak_memory_kb'] * (1 + threshold):
+            regressions.append(
+                f'{name}: peak memory {baseline_result["peak_memory_kb"]} KB -> {result["peak_memory_kb"]} KB'
+            )
+
+    return regressions
@@ -0,0 +1,112 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from api.replicas import current_read_database
+
+
+STATS_VERSION_KEY = 'ownhoops:stats-version'
+STATS_WRITTEN_KEY = 'ownhoops:stats-written'
+RESOURCE_VERSION_KEY = 'ownhoops:version:{}'
+LEAGUE_RESOURCE = 'league'
+
+
+def get_stats_version():
+    return cache.get_or_set(STATS_VERSION_KEY, time.time_ns, None)
+
+
+def bump_stats_version():
+    def bump():
+        try:
+            cache.incr(STATS_VERSION_KEY)
+        except ValueError:
+            cache.set(STATS_VERSION_KEY, time.time_ns(), None)
+        cache.set(STATS_WRITTEN_KEY, time.time_ns(), None)
+
+    transaction.on_commit(bump)
+
+
+def get_cache_timeout(get_last_write):
+    if current_read_database.get() is None:
+        return settings.API_CACHE_TIMEOUT
+    if time.time_ns() - get_last_write() < settings.REPLICA_STICKY_SECONDS * 1_000_000_000:
+        return 0
+    return settings.API_CACHE_TIMEOUT
+
+
+def get_or_compute(key, compute):
+    if not settings.API_CACHE_ENABLED:
+        return compute()
+
+    versioned_key = f'ownhoops:{get_stats_version()}:{key}'
+    timeout = get_cache_timeout(lambda: cache.get(STATS_WRITTEN_KEY, 0))
+    return cache.get_or_set(versioned_key, compute, timeout)
+
+
+def get_resource_version_keys(resources):
+    return [RESOURCE_VERSION_KEY.format(resource) for resource in (LEAGUE_RESOURCE, *resources)]
+
+
+def get_resource_versions(resources):
+    keys = get_resource_version_keys(resources)
+    versions = cache.get_many(keys)
+    missing_versions = {key: time.time_ns() for key in keys if key not in versions}
+
+    if missing_versions:
+        cache.set_many(missing_versions, None)
+        versions.update(missing_versions)
+
+    return [versions[key] for key in keys]
+
+
+async def aget_resource_versions(resources):
+    keys = get_resource_version_keys(resources)
+    versions = await cache.aget_many(keys)
+    missing_versions = {key: time.time_ns() for key in keys if key not in versions}
+
+    if missing_versions:
+        await cache.aset_many(missing_versions, None)
+        versions.update(missing_versions)
+
+    return [versions[key] for key in keys]
+
+
+def bump_resource_versions(resources):
+    keys = {RESOURCE_VERSION_KEY.format(resource) for resource in resources}
+
+    def bump():
+        cache.set_many({key: time.time_ns() for key in keys}, None)
+
+    transaction.on_commit(bump)
+
+
+def bump_league_version():
+    bump_resource_versions([LEAGUE_RESOURCE])
+
+
+def get_response_key(versions, key):
+    versions = ':'.join(str(version) for version in versions)
+    return f'ownhoops:response:{versions}:{hashlib.sha1(key.encode()).hexdigest()}'
+
+
+def get_or_compute_response(resources, key, compute):
+    if not settings.API_CACHE_ENABLED:
+        return compute()
+
+    versions = get_resource_versions(resources)
+    timeout = get_cache_timeout(lambda: max(versions))
+    return cache.get_or_set(get_response_key(versions, key), compute, timeout)
+
+
+async def aget_or_compute_response(resources, key, compute):
+    if not settings.API_CACHE_ENABLED:
+        return await compute()
+
+    versions = await aget_resource_versions(resources)
+    response_key = get_response_key(versions, key)
+    data = await cache.aget(response_key)
+    if data is None:
+        data = await compute()
+        await cache.aset(response_key, data, get_cache_timeout(lambda: max(versions)))
+    return data
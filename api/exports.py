@@ -0,0 +1,105 @@
+import csv
+import itertools
+import json
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from api.models import Player, Game, Stats
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_RESOURCES = ['stats', 'games', 'players']
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def get_export_queryset(resource):
+    if resource == 'stats':
+        return Stats.objects.order_by('id').values(
+            'id',
+            'game_id',
+            'player_id',
+            'field_goals_made',
+            'field_goals_attempted',
+            'three_pointers_made',
+            'three_pointers_attempted',
+            'free_throws_made',
+            'free_throws_attempted',
+            'offensive_rebounds',
+            'defensive_rebounds',
+            'assists',
+            'steals',
+            'blocks',
+            'turnovers',
+            game_date=F('game__date'),
+            player_name=F('player__name'),
+            points=F('free_throws_made') + F('field_goals_made') * 2 + F('three_pointers_made'),
+        )
+    elif resource == 'games':
+        return Game.objects.order_by('date', 'id').values(
+            'id',
+            'date',
+            'home_team_id',
+            'away_team_id',
+            'home_team_score',
+            'away_team_score',
+            home_team_name_abbreviation=F('home_team__name_abbreviation'),
+            away_team_name_abbreviation=F('away_team__name_abbreviation'),
+        )
+    elif resource == 'players':
+        return Player.objects.order_by('id').values(
+            'id',
+            'name',
+            'team_id',
+            'date_of_birth',
+            'country',
+            'position',
+            'height',
+            'weight',
+            'jersey_number',
+            team_name_abbreviation=F('team__name_abbreviation'),
+        )
+    else:
+        raise ValueError(f'Unknown export resource: {resource}')
+
+
+def get_export_columns(queryset):
+    return [*queryset.query.values_select, *queryset.query.annotation_select]
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def stream_csv(queryset):
+    writer = csv.writer(Echo())
+    yield writer.writerow(get_export_columns(queryset))
+
+    for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield writer.writerow(row.values())
+
+
+def stream_ndjson(queryset):
+    for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def stream_export(resource, export_format):
+    queryset = get_export_queryset(resource)
+
+    if export_format == 'csv':
+        return stream_csv(queryset)
+    else:
+        return stream_ndjson(queryset)
+
+
+async def astream_export(resource, export_format):
+    chunks = stream_export(resource, export_format)
+    next_batch = sync_to_async(lambda: ''.join(itertools.islice(chunks, EXPORT_CHUNK_SIZE)))
+    while batch := await next_batch():
+        yield batch
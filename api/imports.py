@@ -0,0 +1,465 @@
+import csv
+import io
+import json
+from collections import defaultdict
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+from api.cache import bump_stats_version, bump_league_version
+from api.models import Team, Player, Game, Stats, PlayerAverages
+from api.serializers import TeamSerializer, PlayerSerializer, StatsSerializer
+from api.validators import SCHEDULE_CONFLICT_WINDOW, find_schedule_conflicts, validate_shot_counts
+
+
+class TeamImportSerializer(serializers.Serializer):
+    name_abbreviation = serializers.CharField(max_length=3)
+    full_name = serializers.CharField(max_length=100)
+
+    validate_name_abbreviation = TeamSerializer.validate_name_abbreviation
+    validate_full_name = TeamSerializer.validate_full_name
+
+
+class PlayerImportSerializer(serializers.Serializer):
+    id = serializers.CharField(max_length=50)
+    name = serializers.CharField(max_length=100)
+    team_name_abbreviation = serializers.CharField(max_length=3, required=False, allow_null=True)
+    date_of_birth = serializers.DateField(required=False, allow_null=True)
+    country = serializers.CharField(max_length=60)
+    position = serializers.ChoiceField(choices=Player.POSITION_CHOICES)
+    height = serializers.IntegerField()
+    weight = serializers.IntegerField()
+    jersey_number = serializers.IntegerField(required=False, allow_null=True)
+
+    validate_name = PlayerSerializer.validate_name
+    validate_country = PlayerSerializer.validate_country
+    validate_height = PlayerSerializer.validate_height
+    validate_weight = PlayerSerializer.validate_weight
+
+    def validate_date_of_birth(self, value):
+        return value if value is None else PlayerSerializer.validate_date_of_birth(self, value)
+
+    def validate_jersey_number(self, value):
+        return value if value is None else PlayerSerializer.validate_jersey_number(self, value)
+
+
+class GameImportSerializer(serializers.Serializer):
+    id = serializers.CharField(max_length=50)
+    date = serializers.DateTimeField()
+    home_team_name_abbreviation = serializers.CharField(max_length=3)
+    away_team_name_abbreviation = serializers.CharField(max_length=3)
+
+
+class StatsImportSerializer(serializers.Serializer):
+    game_id = serializers.CharField(max_length=50)
+    player_id = serializers.CharField(max_length=50)
+    field_goals_made = serializers.IntegerField()
+    field_goals_attempted = serializers.IntegerField()
+    three_pointers_made = serializers.IntegerField()
+    three_pointers_attempted = serializers.IntegerField()
+    free_throws_made = serializers.IntegerField()
+    free_throws_attempted = serializers.IntegerField()
+    offensive_rebounds = serializers.IntegerField()
+    defensive_rebounds = serializers.IntegerField()
+    assists = serializers.IntegerField()
+    steals = serializers.IntegerField()
+    blocks = serializers.IntegerField()
+    turnovers = serializers.IntegerField()
+
+    validate_field_goals_made = StatsSerializer.validate_field_goals_made
+    validate_field_goals_attempted = StatsSerializer.validate_field_goals_attempted
+    validate_three_pointers_made = StatsSerializer.validate_three_pointers_made
+    validate_three_pointers_attempted = StatsSerializer.validate_three_pointers_attempted
+    validate_free_throws_made = StatsSerializer.validate_free_throws_made
+    validate_free_throws_attempted = StatsSerializer.validate_free_throws_attempted
+    validate_offensive_rebounds = StatsSerializer.validate_offensive_rebounds
+    validate_defensive_rebounds = StatsSerializer.validate_defensive_rebounds
+    validate_assists = StatsSerializer.validate_assists
+    validate_steals = StatsSerializer.validate_steals
+    validate_blocks = StatsSerializer.validate_blocks
+    validate_turnovers = StatsSerializer.validate_turnovers
+
+    def validate(self, data):
+        return validate_shot_counts(data)
+
+
+STAGING_TABLES = {
+    'teams': (TeamImportSerializer, [], '''
+        CREATE TEMPORARY TABLE import_teams (
+            row_number integer PRIMARY KEY,
+            source text NOT NULL,
+            name_abbreviation varchar(3) NOT NULL,
+            full_name varchar(100) NOT NULL,
+            rejection text
+        ) ON COMMIT DROP
+    '''),
+    'players': (PlayerImportSerializer, [['id'], ['team_name_abbreviation']], '''
+        CREATE TEMPORARY TABLE import_players (
+            row_number integer PRIMARY KEY,
+            source text NOT NULL,
+            id varchar(50) NOT NULL,
+            name varchar(100) NOT NULL,
+            team_name_abbreviation varchar(3),
+            date_of_birth date,
+            country varchar(60) NOT NULL,
+            position varchar(2) NOT NULL,
+            height integer NOT NULL,
+            weight integer NOT NULL,
+            jersey_number integer,
+            team_id bigint,
+            db_id bigint,
+            rejection text
+        ) ON COMMIT DROP
+    '''),
+    'games': (GameImportSerializer, [['id']], '''
+        CREATE TEMPORARY TABLE import_games (
+            row_number integer PRIMARY KEY,
+            source text NOT NULL,
+            id varchar(50) NOT NULL,
+            date timestamp with time zone NOT NULL,
+            home_team_name_abbreviation varchar(3) NOT NULL,
+            away_team_name_abbreviation varchar(3) NOT NULL,
+            home_team_id bigint,
+            away_team_id bigint,
+            db_id bigint,
+            rejection text
+        ) ON COMMIT DROP
+    '''),
+    'stats': (StatsImportSerializer, [['game_id'], ['player_id'], ['game_db_id', 'player_db_id']], '''
+        CREATE TEMPORARY TABLE import_stats (
+            row_number integer PRIMARY KEY,
+            source text NOT NULL,
+            game_id varchar(50) NOT NULL,
+            player_id varchar(50) NOT NULL,
+            field_goals_made integer NOT NULL,
+            field_goals_attempted integer NOT NULL,
+            three_pointers_made integer NOT NULL,
+            three_pointers_attempted integer NOT NULL,
+            free_throws_made integer NOT NULL,
+            free_throws_attempted integer NOT NULL,
+            offensive_rebounds integer NOT NULL,
+            defensive_rebounds integer NOT NULL,
+            assists integer NOT NULL,
+            steals integer NOT NULL,
+            blocks integer NOT NULL,
+            turnovers integer NOT NULL,
+            game_db_id bigint,
+            player_db_id bigint,
+            rejection text
+        ) ON COMMIT DROP
+    '''),
+}
+
+
+def read_rows(path):
+    with open(path, newline='') as import_file:
+        if path.endswith('.ndjson'):
+            for line in import_file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(import_file):
+                yield {key: value if value != '' else None for key, value in row.items()}
+
+
+class SeasonImport:
+    def __init__(self):
+        self.rejected = []
+        self.imported = {}
+        self.affected_games = set()
+        self.affected_players = set()
+        self.tables = {
+            'team': Team._meta.db_table,
+            'player': Player._meta.db_table,
+            'game': Game._meta.db_table,
+            'stats': Stats._meta.db_table,
+        }
+
+    def execute(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql.format(**self.tables), params)
+            return cursor.rowcount
+
+    def stage(self, name, path):
+        serializer_class, indexes, create_table_sql = STAGING_TABLES[name]
+        serializer = serializer_class()
+        columns = list(serializer.fields)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        for row_number, row in enumerate(read_rows(path), start=1):
+            try:
+                validated_row = serializer.run_validation(row)
+            except serializers.ValidationError as exc:
+                self.rejected.append({'file': name, 'row': row_number, 'errors': exc.detail, 'data': row})
+                continue
+
+            source = json.dumps(row, cls=DjangoJSONEncoder)
+            writer.writerow([row_number, source, *(validated_row.get(column) for column in columns)])
+
+        buffer.seek(0)
+        with connection.cursor() as cursor:
+            cursor.execute(create_table_sql)
+            cursor.copy_expert(
+                f'COPY import_{name} (row_number, source, {", ".join(columns)}) FROM STDIN WITH (FORMAT csv)',
+                buffer,
+            )
+            for index_columns in indexes:
+                cursor.execute(f'CREATE INDEX ON import_{name} ({", ".join(index_columns)})')
+            cursor.execute(f'ANALYZE import_{name}')
+
+    def reject(self, name, message, condition):
+        return self.execute(
+            f'UPDATE import_{name} AS staged SET rejection = %s WHERE staged.rejection IS NULL AND ({condition})',
+            [message],
+        )
+
+    def reject_duplicates(self, name, message, columns):
+        self.execute(f'''
+            UPDATE import_{name} AS staged SET rejection = %s
+            FROM (
+                SELECT row_number, ROW_NUMBER() OVER (PARTITION BY {", ".join(columns)} ORDER BY row_number) AS position
+                FROM import_{name}
+                WHERE rejection IS NULL AND {" AND ".join(f"{column} IS NOT NULL" for column in columns)}
+            ) AS ranked
+            WHERE ranked.row_number = staged.row_number AND ranked.position > 1
+        ''', [message])
+
+    def reject_duplicate_ids(self, name):
+        self.reject_duplicates(name, 'Duplicate id in import file.', ['id'])
+
+    def reject_duplicate_teams(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT row_number, name_abbreviation, full_name FROM import_teams '
+                'WHERE rejection IS NULL ORDER BY row_number'
+            )
+            staged_teams = cursor.fetchall()
+
+        name_abbreviations = set()
+        full_names = set()
+        rejections = []
+        for row_number, name_abbreviation, full_name in staged_teams:
+            if name_abbreviation in name_abbreviations or full_name in full_names:
+                rejections.append(('Duplicate team in import file.', row_number))
+            else:
+                name_abbreviations.add(name_abbreviation)
+                full_names.add(full_name)
+
+        with connection.cursor() as cursor:
+            cursor.executemany('UPDATE import_teams SET rejection = %s WHERE row_number = %s', rejections)
+
+    def import_teams(self):
+        self.reject('teams', 'Team already exists.', '''
+            EXISTS (
+                SELECT 1 FROM {team} AS team
+                WHERE team.name_abbreviation = staged.name_abbreviation OR team.full_name = staged.full_name
+            )
+        ''')
+        self.reject_duplicate_teams()
+        self.imported['teams'] = self.execute('''
+            INSERT INTO {team} (name_abbreviation, full_name, updated_at)
+            SELECT name_abbreviation, full_name, now() FROM import_teams WHERE rejection IS NULL ORDER BY row_number
+        ''')
+
+    def import_players(self):
+        self.reject_duplicate_ids('players')
+        self.execute('''
+            UPDATE import_players AS staged SET team_id = team.id
+            FROM {team} AS team WHERE team.name_abbreviation = staged.team_name_abbreviation
+        ''')
+        self.reject('players', 'Invalid team.', 'staged.team_name_abbreviation IS NOT NULL AND staged.team_id IS NULL')
+        jersey_taken = 'This jersey number is already assigned to a player in this team.'
+        self.reject('players', jersey_taken, '''
+            EXISTS (
+                SELECT 1 FROM {player} AS player
+                WHERE player.team_id = staged.team_id AND player.jersey_number = staged.jersey_number
+            )
+        ''')
+        self.reject_duplicates('players', jersey_taken, ['team_id', 'jersey_number'])
+        self.execute('''
+            UPDATE import_players SET db_id = nextval(pg_get_serial_sequence('{player}', 'id'))
+            WHERE rejection IS NULL
+        ''')
+        self.imported['players'] = self.execute('''
+            INSERT INTO {player} (
+                id, name, team_id, date_of_birth, country, position, height, weight, jersey_number, updated_at
+            )
+            SELECT db_id, name, team_id, date_of_birth, country, position, height, weight, jersey_number, now()
+            FROM import_players WHERE rejection IS NULL ORDER BY row_number
+        ''')
+
+    def reject_schedule_conflicts(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT row_number, home_team_id, away_team_id, date FROM import_games '
+                'WHERE rejection IS NULL ORDER BY row_number'
+            )
+            staged_games = [
+                {'row_number': row_number, 'home_team_id': home_team_id, 'away_team_id': away_team_id, 'date': date}
+                for row_number, home_team_id, away_team_id, date in cursor.fetchall()
+            ]
+
+        if not staged_games:
+            return
+
+        team_ids = {team_id for game in staged_games for team_id in (game['home_team_id'], game['away_team_id'])}
+        existing_games = Game.objects.filter(
+            Q(home_team_id__in=team_ids) | Q(away_team_id__in=team_ids),
+            date__gte=min(game['date'] for game in staged_games) - SCHEDULE_CONFLICT_WINDOW,
+            date__lte=max(game['date'] for game in staged_games) + SCHEDULE_CONFLICT_WINDOW,
+        ).values('home_team_id', 'away_team_id', 'date')
+        team_calendars = defaultdict(list)
+
+        def add_to_calendars(game):
+            team_calendars[game['home_team_id']].append(game)
+            team_calendars[game['away_team_id']].append(game)
+
+        for game in existing_games:
+            add_to_calendars(game)
+
+        rejections = []
+        for game in staged_games:
+            nearby_games = {
+                id(other_game): other_game
+                for team_id in (game['home_team_id'], game['away_team_id'])
+                for other_game in team_calendars[team_id]
+                if abs(other_game['date'] - game['date']) <= SCHEDULE_CONFLICT_WINDOW
+            }
+            error = find_schedule_conflicts([game], nearby_games.values())[0]
+            if error is None:
+                add_to_calendars(game)
+            else:
+                rejections.append((error, game['row_number']))
+
+        with connection.cursor() as cursor:
+            cursor.executemany('UPDATE import_games SET rejection = %s WHERE row_number = %s', rejections)
+
+    def import_games(self):
+        self.reject_duplicate_ids('games')
+        self.execute('''
+            UPDATE import_games AS staged SET home_team_id = home_team.id, away_team_id = away_team.id
+            FROM {team} AS home_team, {team} AS away_team
+            WHERE home_team.name_abbreviation = staged.home_team_name_abbreviation
+            AND away_team.name_abbreviation = staged.away_team_name_abbreviation
+        ''')
+        self.reject('games', 'Invalid home or away team.', 'staged.home_team_id IS NULL OR staged.away_team_id IS NULL')
+        self.reject('games', 'Home team and Away team cannot be the same.', 'staged.home_team_id = staged.away_team_id')
+        self.reject_schedule_conflicts()
+        self.execute('''
+            UPDATE import_games SET db_id = nextval(pg_get_serial_sequence('{game}', 'id'))
+            WHERE rejection IS NULL
+        ''')
+        self.imported['games'] = self.execute('''
+            INSERT INTO {game} (id, date, home_team_id, away_team_id, home_team_score, away_team_score, updated_at)
+            SELECT db_id, date, home_team_id, away_team_id, 0, 0, now()
+            FROM import_games WHERE rejection IS NULL ORDER BY row_number
+        ''')
+
+    def import_stats(self, staged_games, staged_players):
+        if staged_games:
+            self.execute('''
+                UPDATE import_stats AS staged SET game_db_id = game.db_id
+                FROM import_games AS game WHERE game.id = staged.game_id AND game.rejection IS NULL
+            ''')
+        else:
+            self.execute('''
+                UPDATE import_stats AS staged SET game_db_id = game.id
+                FROM {game} AS game WHERE game.id::text = staged.game_id
+            ''')
+
+        if staged_players:
+            self.execute('''
+                UPDATE import_stats AS staged SET player_db_id = player.db_id
+                FROM import_players AS player WHERE player.id = staged.player_id AND player.rejection IS NULL
+            ''')
+        else:
+            self.execute('''
+                UPDATE import_stats AS staged SET player_db_id = player.id
+                FROM {player} AS player WHERE player.id::text = staged.player_id
+            ''')
+
+        self.execute('ANALYZE import_stats')
+        self.reject('stats', 'Invalid game.', 'staged.game_db_id IS NULL')
+        self.reject('stats', 'Invalid player.', 'staged.player_db_id IS NULL')
+        self.reject('stats', 'This player is not in the team participating in the game.', f'''
+            EXISTS (
+                SELECT 1 FROM {self.tables['player']} AS player, {self.tables['game']} AS game
+                WHERE player.id = staged.player_db_id AND game.id = staged.game_db_id
+                AND player.team_id IS DISTINCT FROM game.home_team_id
+                AND player.team_id IS DISTINCT FROM game.away_team_id
+            )
+        ''')
+        duplicate_statline = 'Cannot have two instances of stats of the same player in one game.'
+        self.reject('stats', duplicate_statline, '''
+            EXISTS (
+                SELECT 1 FROM {stats} AS stats
+                WHERE stats.game_id = staged.game_db_id AND stats.player_id = staged.player_db_id
+            )
+        ''')
+        self.reject_duplicates('stats', duplicate_statline, ['game_db_id', 'player_db_id'])
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT DISTINCT game_db_id, player_db_id FROM import_stats WHERE rejection IS NULL'
+            )
+            imported_pairs = cursor.fetchall()
+
+        self.affected_games = {game_id for game_id, _ in imported_pairs}
+        self.affected_players = {player_id for _, player_id in imported_pairs}
+
+        stat_columns = [column for column in StatsImportSerializer().fields if column not in ('game_id', 'player_id')]
+        self.imported['stats'] = self.execute(f'''
+            INSERT INTO {{stats}} (game_id, player_id, {", ".join(stat_columns)}, updated_at)
+            SELECT game_db_id, player_db_id, {", ".join(stat_columns)}, now()
+            FROM import_stats WHERE rejection IS NULL ORDER BY row_number
+        ''')
+
+    def collect_rejections(self, names):
+        with connection.cursor() as cursor:
+            for name in names:
+                cursor.execute(
+                    f'SELECT row_number, source, rejection FROM import_{name} '
+                    f'WHERE rejection IS NOT NULL ORDER BY row_number'
+                )
+                for row_number, source, rejection in cursor.fetchall():
+                    self.rejected.append({
+                        'file': name,
+                        'row': row_number,
+                        'errors': {'non_field_errors': [rejection]},
+                        'data': json.loads(source),
+                    })
+
+    def run(self, teams=None, players=None, games=None, stats=None):
+        paths = {'teams': teams, 'players': players, 'games': games, 'stats': stats}
+        staged = [name for name, path in paths.items() if path]
+
+        for name in staged:
+            self.stage(name, paths[name])
+
+        if teams:
+            self.import_teams()
+        if players:
+            self.import_players()
+        if games:
+            self.import_games()
+        if stats:
+            self.import_stats(staged_games=bool(games), staged_players=bool(players))
+
+        self.collect_rejections(staged)
+        self.rejected.sort(key=lambda rejection: (staged.index(rejection['file']), rejection['row']))
+
+        if self.imported.get('stats'):
+            PlayerAverages.rebuild(self.affected_players)
+            Game.objects.filter(pk__in=self.affected_games).refresh_scores()
+            Player.objects.filter(pk__in=self.affected_players).update(updated_at=timezone.now())
+
+        if self.imported.get('players') or self.imported.get('games') or self.imported.get('stats'):
+            Team.objects.update(updated_at=timezone.now())
+
+        if any(self.imported.values()):
+            bump_stats_version()
+            bump_league_version()
+
+        return self.imported, self.rejected
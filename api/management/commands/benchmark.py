@@ -0,0 +1,127 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+from django.urls import reverse
+from api.benchmarks import (
+    seed_league,
+    delete_league,
+    get_benchmark_samples,
+    get_benchmark_endpoints,
+    run_benchmarks,
+    run_connection_benchmarks,
+    compare_with_baseline,
+)
+from api.models import Team
+from api.urls import urlpatterns
+
+
+class Command(BaseCommand):
+    help = (
+        'Seeds a synthetic league inside a transaction that is rolled back afterwards and measures latency, '
+        'query counts and peak memory of every GET endpoint. Run it against an empty database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--teams', type=int, default=30)
+        parser.add_argument('--players-per-team', type=int, default=15)
+        parser.add_argument('--games-per-team', type=int, default=82)
+        parser.add_argument('--players-per-game', type=int, default=12)
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--warm-cache', action='store_true', help='Keep the response cache between requests.')
+        parser.add_argument('--endpoint', action='append', help='Only benchmark these URL names.')
+        parser.add_argument('--output', help='File to write the results to as JSON.')
+        parser.add_argument('--baseline', help='JSON results to compare against.')
+        parser.add_argument('--threshold', type=float, default=0.2, help='Allowed relative slowdown (0.2 = 20%%).')
+        parser.add_argument(
+            '--connections',
+            action='store_true',
+            help=(
+                'Also compare a new database connection per request with persistent, health checked connections. '
+                'Connections cannot be closed inside the rolled back transaction, so this seeds the league again, '
+                'commits it and deletes it afterwards.'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if Team.objects.exists():
+            raise CommandError('The benchmark seeds its own league and needs an empty database.')
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as baseline_file:
+                baseline = json.load(baseline_file)
+
+        league = {
+            'seed': options['seed'],
+            'team_count': options['teams'],
+            'players_per_team': options['players_per_team'],
+            'games_per_team': options['games_per_team'],
+            'players_per_game': options['players_per_game'],
+        }
+        local_cache = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        with override_settings(CACHES=local_cache, API_CACHE_ENABLED=True, ALLOWED_HOSTS=['testserver']):
+            with transaction.atomic():
+                dataset = seed_league(**league)
+                endpoints = get_benchmark_endpoints(urlpatterns)
+                if options['endpoint']:
+                    endpoints = {name: url for name, url in endpoints.items() if name in options['endpoint']}
+
+                results = run_benchmarks(
+                    endpoints,
+                    iterations=options['iterations'],
+                    warmup=options['warmup'],
+                    cold_cache=not options['warm_cache'],
+                )
+                transaction.set_rollback(True)
+
+            connection_results = None
+            if options['connections']:
+                try:
+                    with transaction.atomic():
+                        seed_league(**league)
+                    team = get_benchmark_samples()['team']
+                    connection_results = run_connection_benchmarks(
+                        reverse('team-coach-list', args=[team.pk]),
+                        iterations=options['iterations'],
+                    )
+                finally:
+                    delete_league()
+
+        report = {
+            'dataset': dataset,
+            'iterations': options['iterations'],
+            'cold_cache': not options['warm_cache'],
+            'endpoints': results,
+        }
+        if connection_results is not None:
+            report['connections'] = connection_results
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                json.dump(report, output_file, indent=4)
+
+        self.stdout.write(
+            f'{dataset["teams"]} teams, {dataset["players"]} players, {dataset["games"]} games, '
+            f'{dataset["stats"]} stats'
+        )
+        self.stdout.write(f'{"endpoint":<28}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"queries":>9}{"peak KB":>10}')
+        for name, result in results.items():
+            self.stdout.write(
+                f'{name:<28}{result["p50_ms"]:>10}{result["p95_ms"]:>10}{result["p99_ms"]:>10}'
+                f'{result["queries"]:>9}{result["peak_memory_kb"]:>10}'
+            )
+
+        if connection_results is not None:
+            self.stdout.write(f'{"connections":<28}{"p50 ms":>10}{"p95 ms":>10}{"opened":>9}')
+            for mode, result in connection_results.items():
+                self.stdout.write(
+                    f'{mode:<28}{result["p50_ms"]:>10}{result["p95_ms"]:>10}{result["connections_opened"]:>9}'
+                )
+
+        if baseline is not None:
+            regressions = compare_with_baseline(results, baseline['endpoints'], options['threshold'])
+            if regressions:
+                raise CommandError('Regressions against the baseline:\n' + '\n'.join(regressions))
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline.'))
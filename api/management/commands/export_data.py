@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from api.exports import EXPORT_RESOURCES, EXPORT_FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = 'Streams stats, games or players as CSV or NDJSON without loading the whole table into memory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('resource', choices=EXPORT_RESOURCES)
+        parser.add_argument('--format', dest='export_format', choices=list(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', help='File to write to. Defaults to standard output.')
+
+    def handle(self, *args, **options):
+        lines = stream_export(options['resource'], options['export_format'])
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as output_file:
+                output_file.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
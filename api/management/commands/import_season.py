@@ -0,0 +1,41 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from api.imports import SeasonImport
+
+
+class Command(BaseCommand):
+    help = 'Imports a historical season from CSV or NDJSON files using PostgreSQL COPY.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--teams', help='Teams file (name_abbreviation, full_name).')
+        parser.add_argument('--players', help='Players file in the format produced by export_data players.')
+        parser.add_argument('--games', help='Games file in the format produced by export_data games.')
+        parser.add_argument('--stats', help='Stats file in the format produced by export_data stats.')
+        parser.add_argument('--rejected', help='NDJSON file to write rejected rows to. Defaults to standard error.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('import_season requires a PostgreSQL database.')
+
+        paths = {name: options[name] for name in ('teams', 'players', 'games', 'stats')}
+        if not any(paths.values()):
+            raise CommandError('Provide at least one of --teams, --players, --games or --stats.')
+
+        for path in filter(None, paths.values()):
+            if not path.endswith(('.csv', '.ndjson')):
+                raise CommandError(f'{path}: only .csv and .ndjson files are supported.')
+
+        with transaction.atomic():
+            imported, rejected = SeasonImport().run(**paths)
+
+        rejected_lines = [json.dumps(rejection) + '\n' for rejection in rejected]
+        if options['rejected']:
+            with open(options['rejected'], 'w') as rejected_file:
+                rejected_file.writelines(rejected_lines)
+        else:
+            for line in rejected_lines:
+                self.stderr.write(line, ending='')
+
+        summary = ', '.join(f'{count} {name}' for name, count in imported.items())
+        self.stdout.write(self.style.SUCCESS(f'Imported {summary}. Rejected {len(rejected)} rows.'))
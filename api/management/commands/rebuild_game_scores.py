@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.cache import bump_stats_version, bump_league_version
+from api.models import Game
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the stored home and away scores of every game from its stat lines.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            games = Game.objects.all().refresh_scores()
+            bump_stats_version()
+            bump_league_version()
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt scores for {len(games)} games.'))
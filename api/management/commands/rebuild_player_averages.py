@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.cache import bump_stats_version, bump_league_version
+from api.models import Player, PlayerAverages
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the PlayerAverages read model from all stored stat lines.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('player_ids', nargs='*', type=int, help='Only rebuild these players (default: all).')
+
+    def handle(self, *args, **options):
+        players = Player.objects.all()
+        if options['player_ids']:
+            players = players.filter(pk__in=options['player_ids'])
+
+        with transaction.atomic():
+            PlayerAverages.rebuild(players.values('pk'))
+            bump_stats_version()
+            bump_league_version()
+
+        rebuilt = PlayerAverages.objects.filter(player__in=players).count()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt averages for {rebuilt} players.'))
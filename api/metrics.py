@@ -0,0 +1,39 @@
+import time
+from contextvars import ContextVar
+
+
+current_metrics = ContextVar('ownhoops_request_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_depth = 0
+        self.view_started = None
+        self.view_time = 0.0
+
+    def record_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+
+class TimedRepresentationMixin:
+    def to_representation(self, instance):
+        metrics = current_metrics.get()
+        if metrics is None or metrics.serializer_depth:
+            return super().to_representation(instance)
+
+        metrics.serializer_depth += 1
+        started = time.perf_counter()
+        db_time = metrics.db_time
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_depth -= 1
+            metrics.serializer_time += time.perf_counter() - started - (metrics.db_time - db_time)
@@ -0,0 +1,170 @@
+import json
+import logging
+import random
+import time
+from contextlib import ExitStack
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.views import APIView
+from api.metrics import RequestMetrics, current_metrics
+from api.replicas import current_read_database
+
+
+logger = logging.getLogger('api.requests')
+
+PRIMARY_COOKIE = 'ownhoops_primary'
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        started = time.perf_counter()
+
+        try:
+            with self.record_queries(metrics):
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+
+        self.finish(request, response, metrics, started)
+        return response
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        started = time.perf_counter()
+
+        try:
+            query_recording = await sync_to_async(self.record_queries)(metrics)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(query_recording.close)()
+        finally:
+            current_metrics.reset(token)
+
+        self.finish(request, response, metrics, started)
+        return response
+
+    def record_queries(self, metrics):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics.record_query))
+        return stack
+
+    def finish(self, request, response, metrics, started):
+        finished = time.perf_counter()
+        if metrics.view_started is not None:
+            metrics.view_time = finished - metrics.view_started
+
+        self.report(request, response, metrics, finished - started)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.view_started = time.perf_counter()
+
+    def report(self, request, response, metrics, total_time):
+        over_budget = []
+        if metrics.queries > settings.REQUEST_METRICS_QUERY_BUDGET:
+            over_budget.append('queries')
+        if total_time * 1000 > settings.REQUEST_METRICS_TIME_BUDGET_MS:
+            over_budget.append('time')
+
+        server_timing = [
+            f'db;dur={metrics.db_time * 1000:.2f};desc="{metrics.queries} queries"',
+            f'serializer;dur={metrics.serializer_time * 1000:.2f}',
+            f'view;dur={metrics.view_time * 1000:.2f}',
+            f'total;dur={total_time * 1000:.2f}',
+        ]
+        if over_budget:
+            server_timing.append(f'budget;desc="exceeded: {", ".join(over_budget)}"')
+        response['Server-Timing'] = ', '.join(server_timing)
+
+        request_metrics = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': metrics.queries,
+            'db_ms': round(metrics.db_time * 1000, 2),
+            'serializer_ms': round(metrics.serializer_time * 1000, 2),
+            'view_ms': round(metrics.view_time * 1000, 2),
+            'total_ms': round(total_time * 1000, 2),
+            'over_budget': over_budget,
+        }
+        logger.log(
+            logging.WARNING if over_budget else logging.INFO,
+            json.dumps(request_metrics),
+            extra={'request_metrics': request_metrics},
+        )
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            current_read_database.set(None)
+
+        return self.pin_to_primary(request, response)
+
+    async def __acall__(self, request):
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_read_database.set(None)
+
+        return self.pin_to_primary(request, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'cls', None)
+        if (
+            request.method in SAFE_METHODS
+            and view_class is not None
+            and issubclass(view_class, APIView)
+            and PRIMARY_COOKIE not in request.COOKIES
+        ):
+            current_read_database.set(random.choice(settings.DATABASE_REPLICAS))
+
+    def pin_to_primary(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                '1',
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
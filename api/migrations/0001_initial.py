@@ -0,0 +1,87 @@
+# Generated by Django 4.2.9 on 2026-10-17 21:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Game',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Player',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('date_of_birth', models.DateField(blank=True, null=True)),
+                ('country', models.CharField(max_length=60)),
+                ('position', models.CharField(choices=[('PG', 'Point Guard'), ('SG', 'Shooting Guard'), ('SF', 'Small Forward'), ('PF', 'Power Forward'), ('C', 'Center')], max_length=2)),
+                ('height', models.IntegerField()),
+                ('weight', models.IntegerField()),
+                ('jersey_number', models.IntegerField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Team',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name_abbreviation', models.CharField(max_length=3, unique=True)),
+                ('full_name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Stats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field_goals_made', models.IntegerField()),
+                ('field_goals_attempted', models.IntegerField()),
+                ('three_pointers_made', models.IntegerField()),
+                ('three_pointers_attempted', models.IntegerField()),
+                ('free_throws_made', models.IntegerField()),
+                ('free_throws_attempted', models.IntegerField()),
+                ('defensive_rebounds', models.IntegerField()),
+                ('offensive_rebounds', models.IntegerField()),
+                ('assists', models.IntegerField()),
+                ('steals', models.IntegerField()),
+                ('blocks', models.IntegerField()),
+                ('turnovers', models.IntegerField()),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='api.game')),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='api.player')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='team',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='players', to='api.team'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='away_team',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='away_games', to='api.team'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='home_team',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='home_games', to='api.team'),
+        ),
+        migrations.CreateModel(
+            name='Coach',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('date_of_birth', models.DateField()),
+                ('team', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='coach', to='api.team')),
+            ],
+        ),
+    ]
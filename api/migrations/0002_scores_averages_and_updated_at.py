@@ -0,0 +1,132 @@
+# Generated by Django 4.2.9 on 2026-10-17 21:34
+
+from django.db import migrations, models
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def backfill_scores_and_averages(apps, schema_editor):
+    Game = apps.get_model('api', 'Game')
+    Player = apps.get_model('api', 'Player')
+    PlayerAverages = apps.get_model('api', 'PlayerAverages')
+
+    points = F('stats__free_throws_made') + F('stats__field_goals_made') * 2 + F('stats__three_pointers_made')
+    games = list(Game.objects.annotate(
+        computed_home_team_score=Coalesce(Sum(points, filter=Q(stats__player__team=F('home_team'))), 0),
+        computed_away_team_score=Coalesce(Sum(points, filter=Q(stats__player__team=F('away_team'))), 0),
+    ))
+    for game in games:
+        game.home_team_score = game.computed_home_team_score
+        game.away_team_score = game.computed_away_team_score
+    Game.objects.bulk_update(games, ['home_team_score', 'away_team_score'], batch_size=500)
+
+    totalled_stats = {
+        'points': points,
+        'offensive_rebounds': F('stats__offensive_rebounds'),
+        'defensive_rebounds': F('stats__defensive_rebounds'),
+        'rebounds': F('stats__offensive_rebounds') + F('stats__defensive_rebounds'),
+        'assists': F('stats__assists'),
+        'steals': F('stats__steals'),
+        'blocks': F('stats__blocks'),
+        'turnovers': F('stats__turnovers'),
+        'field_goals_made': F('stats__field_goals_made'),
+        'field_goals_attempted': F('stats__field_goals_attempted'),
+        'three_pointers_made': F('stats__three_pointers_made'),
+        'three_pointers_attempted': F('stats__three_pointers_attempted'),
+        'free_throws_made': F('stats__free_throws_made'),
+        'free_throws_attempted': F('stats__free_throws_attempted'),
+    }
+    totals = Player.objects.annotate(
+        games_played=Count('stats'),
+        **{f'{stat_name}_total': Coalesce(Sum(expression), 0) for stat_name, expression in totalled_stats.items()},
+    ).filter(games_played__gt=0).values('id', 'games_played', *(f'{stat_name}_total' for stat_name in totalled_stats))
+    PlayerAverages.objects.bulk_create(
+        [PlayerAverages(player_id=player_totals.pop('id'), **player_totals) for player_totals in totals],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerAverages',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('games_played', models.IntegerField(default=0)),
+                ('points_total', models.IntegerField(default=0)),
+                ('offensive_rebounds_total', models.IntegerField(default=0)),
+                ('defensive_rebounds_total', models.IntegerField(default=0)),
+                ('rebounds_total', models.IntegerField(default=0)),
+                ('assists_total', models.IntegerField(default=0)),
+                ('steals_total', models.IntegerField(default=0)),
+                ('blocks_total', models.IntegerField(default=0)),
+                ('turnovers_total', models.IntegerField(default=0)),
+                ('field_goals_made_total', models.IntegerField(default=0)),
+                ('field_goals_attempted_total', models.IntegerField(default=0)),
+                ('three_pointers_made_total', models.IntegerField(default=0)),
+                ('three_pointers_attempted_total', models.IntegerField(default=0)),
+                ('free_throws_made_total', models.IntegerField(default=0)),
+                ('free_throws_attempted_total', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='coach',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='away_team_score',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='home_team_score',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='stats',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['home_team', 'date'], name='api_game_home_te_34903e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['away_team', 'date'], name='api_game_away_te_f3bf53_idx'),
+        ),
+        migrations.AddField(
+            model_name='playeraverages',
+            name='player',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='averages', to='api.player'),
+        ),
+        migrations.AddIndex(
+            model_name='playeraverages',
+            index=models.Index(fields=['games_played'], name='api_playera_games_p_e4b84a_idx'),
+        ),
+        migrations.RunPython(backfill_scores_and_averages, migrations.RunPython.noop),
+    ]
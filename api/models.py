@@ -1,9 +1,35 @@
 from django.db import models
+from django.utils import timezone
+from django.db.models import Avg, Count, F, OuterRef, Q, RowRange, Subquery, Sum, Window
+from django.db.models.functions import Cast, Coalesce, NullIf, RowNumber
+
+
+class TeamQuerySet(models.QuerySet):
+    def with_records(self):
+        def decided_games_aggregate(side, aggregate):
+            decided_games = Game.objects.filter(**{side: OuterRef('pk')}).exclude(home_team_score=F('away_team_score'))
+            return Coalesce(Subquery(decided_games.values(side).annotate(value=aggregate).values('value')), 0)
+
+        home_win = Q(home_team_score__gt=F('away_team_score'))
+        away_win = Q(away_team_score__gt=F('home_team_score'))
+        return self.annotate(
+            home_wins=decided_games_aggregate('home_team', Count('pk', filter=home_win)),
+            home_losses=decided_games_aggregate('home_team', Count('pk', filter=away_win)),
+            away_wins=decided_games_aggregate('away_team', Count('pk', filter=away_win)),
+            away_losses=decided_games_aggregate('away_team', Count('pk', filter=home_win)),
+            home_points_for=decided_games_aggregate('home_team', Sum('home_team_score')),
+            home_points_against=decided_games_aggregate('home_team', Sum('away_team_score')),
+            away_points_for=decided_games_aggregate('away_team', Sum('away_team_score')),
+            away_points_against=decided_games_aggregate('away_team', Sum('home_team_score')),
+        )
 
 
 class Team(models.Model):
     name_abbreviation = models.CharField(max_length=3, unique=True, blank=False, null=False)
     full_name = models.CharField(max_length=100, unique=True, blank=False, null=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TeamQuerySet.as_manager()
 
     def __str__(self):
         return self.name_abbreviation
@@ -13,11 +39,38 @@ class Coach(models.Model):
     name = models.CharField(max_length=100, blank=False, null=False)
     date_of_birth = models.DateField(blank=False, null=False)
     team = models.ForeignKey('Team', related_name='coach', on_delete=models.SET_NULL, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
 
 
+class PlayerQuerySet(models.QuerySet):
+    TOTALLED_STATS = {
+        'points': F('stats__free_throws_made') + F('stats__field_goals_made') * 2 + F('stats__three_pointers_made'),
+        'offensive_rebounds': F('stats__offensive_rebounds'),
+        'defensive_rebounds': F('stats__defensive_rebounds'),
+        'rebounds': F('stats__offensive_rebounds') + F('stats__defensive_rebounds'),
+        'assists': F('stats__assists'),
+        'steals': F('stats__steals'),
+        'blocks': F('stats__blocks'),
+        'turnovers': F('stats__turnovers'),
+        'field_goals_made': F('stats__field_goals_made'),
+        'field_goals_attempted': F('stats__field_goals_attempted'),
+        'three_pointers_made': F('stats__three_pointers_made'),
+        'three_pointers_attempted': F('stats__three_pointers_attempted'),
+        'free_throws_made': F('stats__free_throws_made'),
+        'free_throws_attempted': F('stats__free_throws_attempted'),
+    }
+
+    def with_stat_totals(self):
+        totals = {
+            f'{stat_name}_total': Coalesce(Sum(expression), 0)
+            for stat_name, expression in self.TOTALLED_STATS.items()
+        }
+        return self.annotate(games_played=Count('stats'), **totals)
+
+
 class Player(models.Model):
     POSITION_CHOICES = [
         ('PG', 'Point Guard'),
@@ -35,21 +88,119 @@ class Player(models.Model):
     height = models.IntegerField(null=False, blank=False)
     weight = models.IntegerField(null=False, blank=False)
     jersey_number = models.IntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = PlayerQuerySet.as_manager()
 
     def __str__(self):
         return f'{self.name} - DOB: {self.date_of_birth}'
 
 
+class GameQuerySet(models.QuerySet):
+    def with_scores(self):
+        points = F('stats__free_throws_made') + F('stats__field_goals_made') * 2 + F('stats__three_pointers_made')
+        return self.annotate(
+            computed_home_team_score=Coalesce(Sum(points, filter=Q(stats__player__team=F('home_team'))), 0),
+            computed_away_team_score=Coalesce(Sum(points, filter=Q(stats__player__team=F('away_team'))), 0),
+        )
+
+    def refresh_scores(self):
+        games = list(self.with_scores())
+        updated_at = timezone.now()
+        for game in games:
+            game.home_team_score = game.computed_home_team_score
+            game.away_team_score = game.computed_away_team_score
+            game.updated_at = updated_at
+
+        Game.objects.bulk_update(games, ['home_team_score', 'away_team_score', 'updated_at'], batch_size=500)
+        return games
+
+
 class Game(models.Model):
     date = models.DateTimeField(blank=False, null=False)
     home_team = models.ForeignKey('Team', related_name='home_games', on_delete=models.CASCADE)
     away_team = models.ForeignKey('Team', related_name='away_games', on_delete=models.CASCADE)
+    home_team_score = models.IntegerField(default=0)
+    away_team_score = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = GameQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['home_team', 'date']),
+            models.Index(fields=['away_team', 'date']),
+        ]
 
     def __str__(self):
         return f'{self.away_team} @ {self.home_team} - {self.date}'
 
+    def update_scores(self):
+        scores = Game.objects.with_scores().filter(pk=self.pk).values(
+            'computed_home_team_score',
+            'computed_away_team_score',
+        ).first()
+
+        if scores is not None:
+            self.home_team_score = scores['computed_home_team_score']
+            self.away_team_score = scores['computed_away_team_score']
+            self.updated_at = timezone.now()
+            Game.objects.filter(pk=self.pk).update(
+                home_team_score=self.home_team_score,
+                away_team_score=self.away_team_score,
+                updated_at=self.updated_at,
+            )
+
+
+class StatsQuerySet(models.QuerySet):
+    GAME_LOG_STATS = {
+        'points': F('free_throws_made') + F('field_goals_made') * 2 + F('three_pointers_made'),
+        'rebounds': F('offensive_rebounds') + F('defensive_rebounds'),
+        'assists': F('assists'),
+        'steals': F('steals'),
+        'blocks': F('blocks'),
+        'turnovers': F('turnovers'),
+    }
+    GAME_LOG_WINDOWS = {
+        'last_5': RowRange(start=-4, end=0),
+        'last_10': RowRange(start=-9, end=0),
+        'season_to_date': RowRange(start=None, end=0),
+    }
+
+    def with_game_log(self):
+        game_order = [F('game__date').asc(), F('id').asc()]
+        averages = {
+            f'{window_name}_{stat_name}': Window(
+                Avg(expression),
+                partition_by=[F('player')],
+                order_by=game_order,
+                frame=frame,
+            )
+            for window_name, frame in self.GAME_LOG_WINDOWS.items()
+            for stat_name, expression in self.GAME_LOG_STATS.items()
+        }
+        return self.annotate(
+            game_number=Window(RowNumber(), partition_by=[F('player')], order_by=game_order),
+            **averages,
+        )
+
 
 class Stats(models.Model):
+    STAT_FIELDS = [
+        'field_goals_made',
+        'field_goals_attempted',
+        'three_pointers_made',
+        'three_pointers_attempted',
+        'free_throws_made',
+        'free_throws_attempted',
+        'offensive_rebounds',
+        'defensive_rebounds',
+        'assists',
+        'steals',
+        'blocks',
+        'turnovers',
+    ]
+
     game = models.ForeignKey('Game', related_name='stats', on_delete=models.CASCADE)
     player = models.ForeignKey('Player', related_name='stats', on_delete=models.CASCADE)
     field_goals_made = models.IntegerField(null=False, blank=False)
@@ -64,6 +215,116 @@ class Stats(models.Model):
     steals = models.IntegerField(null=False, blank=False)
     blocks = models.IntegerField(null=False, blank=False)
     turnovers = models.IntegerField(null=False, blank=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = StatsQuerySet.as_manager()
 
     def __str__(self):
         return f'{self.game} - {self.player} stats'
+
+    def get_totalled_stats(self):
+        return {
+            'points': self.free_throws_made + self.field_goals_made * 2 + self.three_pointers_made,
+            'offensive_rebounds': self.offensive_rebounds,
+            'defensive_rebounds': self.defensive_rebounds,
+            'rebounds': self.offensive_rebounds + self.defensive_rebounds,
+            'assists': self.assists,
+            'steals': self.steals,
+            'blocks': self.blocks,
+            'turnovers': self.turnovers,
+            'field_goals_made': self.field_goals_made,
+            'field_goals_attempted': self.field_goals_attempted,
+            'three_pointers_made': self.three_pointers_made,
+            'three_pointers_attempted': self.three_pointers_attempted,
+            'free_throws_made': self.free_throws_made,
+            'free_throws_attempted': self.free_throws_attempted,
+        }
+
+
+class PlayerAveragesQuerySet(models.QuerySet):
+    PER_GAME_STATS = {
+        'points_per_game': 'points',
+        'offensive_rebounds_per_game': 'offensive_rebounds',
+        'defensive_rebounds_per_game': 'defensive_rebounds',
+        'rebounds_per_game': 'rebounds',
+        'assists_per_game': 'assists',
+        'steals_per_game': 'steals',
+        'blocks_per_game': 'blocks',
+        'turnovers_per_game': 'turnovers',
+    }
+    PERCENTAGE_STATS = {
+        'field_goal_percentage': ('field_goals_made', 'field_goals_attempted'),
+        'three_point_field_goal_percentage': ('three_pointers_made', 'three_pointers_attempted'),
+        'free_throw_percentage': ('free_throws_made', 'free_throws_attempted'),
+    }
+
+    def with_stat_value(self, stat_name):
+        if stat_name in self.PER_GAME_STATS:
+            total = Cast(f'{self.PER_GAME_STATS[stat_name]}_total', models.FloatField())
+            value = total / NullIf('games_played', 0)
+        else:
+            made_name, attempted_name = self.PERCENTAGE_STATS[stat_name]
+            made = Cast(f'{made_name}_total', models.FloatField())
+            value = made * 100 / NullIf(f'{attempted_name}_total', 0)
+
+        return self.annotate(stat_value=Coalesce(value, 0.0, output_field=models.FloatField()))
+
+
+class PlayerAverages(models.Model):
+    player = models.OneToOneField('Player', related_name='averages', on_delete=models.CASCADE)
+    games_played = models.IntegerField(default=0)
+    points_total = models.IntegerField(default=0)
+    offensive_rebounds_total = models.IntegerField(default=0)
+    defensive_rebounds_total = models.IntegerField(default=0)
+    rebounds_total = models.IntegerField(default=0)
+    assists_total = models.IntegerField(default=0)
+    steals_total = models.IntegerField(default=0)
+    blocks_total = models.IntegerField(default=0)
+    turnovers_total = models.IntegerField(default=0)
+    field_goals_made_total = models.IntegerField(default=0)
+    field_goals_attempted_total = models.IntegerField(default=0)
+    three_pointers_made_total = models.IntegerField(default=0)
+    three_pointers_attempted_total = models.IntegerField(default=0)
+    free_throws_made_total = models.IntegerField(default=0)
+    free_throws_attempted_total = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = PlayerAveragesQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['games_played']),
+        ]
+
+    def __str__(self):
+        return f'{self.player} averages'
+
+    @classmethod
+    def rebuild(cls, player_ids):
+        total_fields = [f'{stat_name}_total' for stat_name in PlayerQuerySet.TOTALLED_STATS]
+        totals = Player.objects.with_stat_totals().filter(pk__in=player_ids).values(
+            'id',
+            'games_played',
+            *total_fields,
+        )
+        cls.objects.bulk_create(
+            [cls(player_id=player_totals.pop('id'), **player_totals) for player_totals in totals],
+            update_conflicts=True,
+            unique_fields=['player'],
+            update_fields=['games_played', *total_fields, 'updated_at'],
+        )
+
+    @classmethod
+    def apply_statline(cls, stats, sign):
+        running_totals = {
+            f'{stat_name}_total': F(f'{stat_name}_total') + sign * value
+            for stat_name, value in stats.get_totalled_stats().items()
+        }
+        updated = cls.objects.filter(player_id=stats.player_id).update(
+            games_played=F('games_played') + sign,
+            updated_at=timezone.now(),
+            **running_totals,
+        )
+
+        if not updated and sign > 0:
+            cls.rebuild([stats.player_id])
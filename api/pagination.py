@@ -0,0 +1,22 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    ordering = 'id'
+    page_size_query_param = 'page_size'
+    max_page_size = settings.MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        if hasattr(view, 'get_cursor_ordering'):
+            return tuple(view.get_cursor_ordering())
+
+        return super().get_ordering(request, queryset, view)
+
+
+class GameKeysetPagination(KeysetPagination):
+    ordering = ('date', 'id')
+
+
+class GameLogPagination(KeysetPagination):
+    ordering = ('game_number',)
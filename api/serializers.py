@@ -1,11 +1,13 @@
-from rest_framework import serializers
+from rest_framework import permissions, serializers
 from rest_framework.validators import UniqueTogetherValidator
-from django.db import models
 from django.db.models import Q
 from django.urls import reverse
 from drf_spectacular.utils import extend_schema_field, extend_schema_serializer, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
-from api.models import Team, Coach, Player, Game, Stats
+from api.advanced import ADVANCED_METRICS
+from api.cache import bump_stats_version, bump_resource_versions
+from api.metrics import TimedRepresentationMixin
+from api.models import Team, Coach, Player, PlayerAverages, Game, Stats, StatsQuerySet
 from api.validators import (
     validate_alpha_and_title,
     validate_future_date,
@@ -13,8 +15,61 @@ from api.validators import (
     validate_over_eighteen,
     validate_nonnegative,
     validate_title_or_number_start,
+    validate_player_in_game,
+    validate_shot_counts,
+    find_schedule_conflicts,
+    SCHEDULE_CONFLICT_WINDOW,
 )
-import datetime
+
+
+class SparseFieldsetsMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return
+
+        requested_fields = request.GET.get('fields')
+        omitted_fields = request.GET.get('omit')
+
+        if requested_fields:
+            allowed_fields = set(requested_fields.split(','))
+            for field_name in set(self.fields) - allowed_fields:
+                self.fields.pop(field_name)
+
+        if omitted_fields:
+            for field_name in omitted_fields.split(','):
+                self.fields.pop(field_name, None)
+
+
+class CoachSummarySerializer(serializers.HyperlinkedModelSerializer):
+    class Meta:
+        model = Coach
+        fields = ['url', 'id', 'name']
+
+
+class PlayerSummarySerializer(serializers.HyperlinkedModelSerializer):
+    class Meta:
+        model = Player
+        fields = ['url', 'id', 'name', 'position', 'jersey_number']
+
+
+class GameSummarySerializer(serializers.HyperlinkedModelSerializer):
+    info = serializers.SerializerMethodField()
+    box_score = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Game
+        fields = ['url', 'id', 'info', 'box_score']
+
+    def get_info(self, obj):
+        game_date = serializers.DateTimeField().to_representation(obj.date)
+        return f'{obj.away_team.name_abbreviation} @ {obj.home_team.name_abbreviation} - {game_date}'
+
+    def get_box_score(self, obj):
+        stats_url = reverse('game-detail', args=[obj.id]) + 'stats/'
+        return self.context['request'].build_absolute_uri(stats_url)
 
 
 @extend_schema_serializer(
@@ -66,7 +121,7 @@ import datetime
         )
     ]
 )
-class TeamSerializer(serializers.HyperlinkedModelSerializer):
+class TeamSerializer(TimedRepresentationMixin, SparseFieldsetsMixin, serializers.HyperlinkedModelSerializer):
     players = serializers.SerializerMethodField()
     coach = serializers.SerializerMethodField()
     games = serializers.SerializerMethodField()
@@ -77,8 +132,8 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer):
 
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_coach(self, obj):
-        coach_instance = obj.coach.first()
-        coach_data = CoachSerializer(coach_instance, context=self.context).data
+        coach_instance = next(iter(obj.coach.all()), None)
+        coach_data = CoachSummarySerializer(coach_instance, context=self.context).data
         return {
             'url': coach_data.get('url', None),
             'id': coach_data.get('id', None),
@@ -87,36 +142,12 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer):
 
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_players(self, obj):
-        players_queryset = obj.players.all()
-        players_data = PlayerSerializer(players_queryset, many=True, context=self.context).data
-        return [
-            {
-                'url': player_data.get('url', None),
-                'id': player_data.get('id', None),
-                'name': player_data.get('name', None),
-                'position': player_data.get('position', None),
-                'jersey_number': player_data.get('jersey_number', None)
-            }
-            for player_data in players_data
-        ]
+        return PlayerSummarySerializer(obj.players.all(), many=True, context=self.context).data
 
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_games(self, obj):
-        games_queryset = obj.home_games.all() | obj.away_games.all()
-        games_data = GameSerializer(games_queryset, many=True, context=self.context).data
-        return [
-            {
-                'url': game_data.get('url', None),
-                'id': game_data.get('id', None),
-                'info': (
-                    f'{game_data.get("away_team_name_abbreviation", None)} @ '
-                    f'{game_data.get("home_team_name_abbreviation", None)} - '
-                    f'{game_data.get("date", None)}'
-                ),
-                'box_score': game_data.get('box_score', None),
-            }
-            for game_data in games_data
-        ]
+        games = sorted([*obj.home_games.all(), *obj.away_games.all()], key=lambda game: game.pk)
+        return GameSummarySerializer(games, many=True, context=self.context).data
 
     def validate_name_abbreviation(self, value):
         if not len(value) == 3:
@@ -155,7 +186,7 @@ class TeamSerializer(serializers.HyperlinkedModelSerializer):
         )
     ]
 )
-class CoachSerializer(serializers.HyperlinkedModelSerializer):
+class CoachSerializer(TimedRepresentationMixin, SparseFieldsetsMixin, serializers.HyperlinkedModelSerializer):
     team_name_abbreviation = serializers.ReadOnlyField(source='team.name_abbreviation')
 
     class Meta:
@@ -216,7 +247,7 @@ class CoachSerializer(serializers.HyperlinkedModelSerializer):
         )
     ]
 )
-class PlayerSerializer(serializers.HyperlinkedModelSerializer):
+class PlayerSerializer(TimedRepresentationMixin, SparseFieldsetsMixin, serializers.HyperlinkedModelSerializer):
     team_name_abbreviation = serializers.ReadOnlyField(source='team.name_abbreviation')
     points_per_game = serializers.SerializerMethodField()
     offensive_rebounds_per_game = serializers.SerializerMethodField()
@@ -231,6 +262,20 @@ class PlayerSerializer(serializers.HyperlinkedModelSerializer):
     free_throw_percentage = serializers.SerializerMethodField()
     all_stats = serializers.SerializerMethodField()
 
+    averages_fields = [
+        'points_per_game',
+        'offensive_rebounds_per_game',
+        'defensive_rebounds_per_game',
+        'rebounds_per_game',
+        'assists_per_game',
+        'steals_per_game',
+        'blocks_per_game',
+        'turnovers_per_game',
+        'field_goal_percentage',
+        'three_point_field_goal_percentage',
+        'free_throw_percentage',
+    ]
+
     class Meta:
         model = Player
         fields = [
@@ -266,13 +311,16 @@ class PlayerSerializer(serializers.HyperlinkedModelSerializer):
             )
         ]
 
+    def get_averages(self, obj):
+        try:
+            return obj.averages
+        except PlayerAverages.DoesNotExist:
+            return PlayerAverages()
+
     def calculate_stat_per_game(self, obj, stat_name):
-        player_stats = Stats.objects.filter(player=obj, player__team=obj.team)
-        total_stat = sum(
-            StatsSerializer(stats, context=self.context).data.get(stat_name, 0)
-            for stats in player_stats
-        )
-        number_of_games = player_stats.count()
+        averages = self.get_averages(obj)
+        total_stat = getattr(averages, f'{stat_name}_total')
+        number_of_games = averages.games_played
 
         if number_of_games == 0:
             return 0.0
@@ -280,15 +328,9 @@ class PlayerSerializer(serializers.HyperlinkedModelSerializer):
             return round(total_stat/number_of_games, 2)
 
     def calculate_stat_percentage(self, obj, stat_name_made, stat_name_attempts):
-        player_stats = Stats.objects.filter(player=obj, player__team=obj.team)
-        stat_made = sum(
-            StatsSerializer(stats, context=self.context).data.get(stat_name_made, 0)
-            for stats in player_stats
-        )
-        stat_attempted = sum(
-            StatsSerializer(stats, context=self.context).data.get(stat_name_attempts, 0)
-            for stats in player_stats
-        )
+        averages = self.get_averages(obj)
+        stat_made = getattr(averages, f'{stat_name_made}_total')
+        stat_attempted = getattr(averages, f'{stat_name_attempts}_total')
 
         if stat_attempted == 0:
             return 0.0
@@ -393,12 +435,10 @@ class PlayerSerializer(serializers.HyperlinkedModelSerializer):
         )
     ]
 )
-class GameSerializer(serializers.HyperlinkedModelSerializer):
+class GameSerializer(TimedRepresentationMixin, SparseFieldsetsMixin, serializers.HyperlinkedModelSerializer):
     game_info = serializers.SerializerMethodField()
     home_team_name_abbreviation = serializers.ReadOnlyField(source='home_team.name_abbreviation')
     away_team_name_abbreviation = serializers.ReadOnlyField(source='away_team.name_abbreviation')
-    home_team_score = serializers.SerializerMethodField()
-    away_team_score = serializers.SerializerMethodField()
     box_score = serializers.SerializerMethodField()
 
     class Meta:
@@ -416,6 +456,7 @@ class GameSerializer(serializers.HyperlinkedModelSerializer):
             'away_team_score',
             'box_score',
         ]
+        read_only_fields = ['home_team_score', 'away_team_score']
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_game_info(self, obj):
@@ -424,24 +465,6 @@ class GameSerializer(serializers.HyperlinkedModelSerializer):
         game_date = obj.date
         return f'{away_team} @ {home_team} - {game_date}'
 
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_home_team_score(self, obj):
-        home_team_stats = Stats.objects.filter(game=obj, player__team=obj.home_team)
-        total_points = sum(
-            StatsSerializer(stats, context=self.context).data.get('points', 0)
-            for stats in home_team_stats
-        )
-        return total_points
-
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_away_team_score(self, obj):
-        away_team_stats = Stats.objects.filter(game=obj, player__team=obj.away_team)
-        total_points = sum(
-            StatsSerializer(stats, context=self.context).data.get('points', 0)
-            for stats in away_team_stats
-        )
-        return total_points
-
     @extend_schema_field(OpenApiTypes.STR)
     def get_box_score(self, obj):
         stats_url = reverse('game-detail', args=[obj.id]) + 'stats/'
@@ -451,70 +474,24 @@ class GameSerializer(serializers.HyperlinkedModelSerializer):
         home_team = data['home_team']
         away_team = data['away_team']
         date = data['date']
+        existing_games = []
 
-        if home_team == away_team:
-            raise serializers.ValidationError('Home team and Away team cannot be the same.')
-
-        if Game.objects.filter(
-            (models.Q(home_team=home_team, away_team=away_team) |
-             models.Q(home_team=away_team, away_team=home_team)),
-            date=date
-        ).exclude(pk=self.instance.pk if self.instance else None).exists():
-            raise serializers.ValidationError('Cannot have two games between the same teams at the same time.')
-
-        if Game.objects.filter(
-            (Q(home_team=home_team, date__gte=date - datetime.timedelta(hours=2)) &
-                Q(home_team=home_team, date__lte=date + datetime.timedelta(hours=2))) |
-            (Q(away_team=home_team, date__gte=date - datetime.timedelta(hours=2)) &
-                Q(away_team=home_team, date__lte=date + datetime.timedelta(hours=2)))
-        ).exclude(pk=self.instance.pk if self.instance else None).exists():
-            raise serializers.ValidationError('Home team has another game around the same time.')
-
-        if Game.objects.filter(
-            (Q(away_team=away_team, date__gte=date - datetime.timedelta(hours=2)) &
-                Q(away_team=away_team, date__lte=date + datetime.timedelta(hours=2))) |
-            (Q(home_team=away_team, date__gte=date - datetime.timedelta(hours=2)) &
-                Q(home_team=away_team, date__lte=date + datetime.timedelta(hours=2)))
-        ).exclude(pk=self.instance.pk if self.instance else None).exists():
-            raise serializers.ValidationError('Away team has another game around the same time.')
+        if home_team != away_team:
+            existing_games = Game.objects.filter(
+                Q(home_team__in=[home_team, away_team]) | Q(away_team__in=[home_team, away_team]),
+                date__gte=date - SCHEDULE_CONFLICT_WINDOW,
+                date__lte=date + SCHEDULE_CONFLICT_WINDOW,
+            ).exclude(pk=self.instance.pk if self.instance else None).values('home_team_id', 'away_team_id', 'date')
+
+        game = {'home_team_id': home_team.pk, 'away_team_id': away_team.pk, 'date': date}
+        error = find_schedule_conflicts([game], existing_games)[0]
+        if error is not None:
+            raise serializers.ValidationError(error)
 
         return data
 
 
-@extend_schema_serializer(
-    examples=[
-        OpenApiExample(
-            'Example Stats',
-            summary='An example statline',
-            value={
-                "url": "http://127.0.0.1:8000/stats/1/",
-                "id": 1,
-                "game": "http://127.0.0.1:8000/games/1/",
-                "game_info": "IND @ MIA - 2024-02-26 20:00:00+00:00",
-                "player": "http://127.0.0.1:8000/players/4/",
-                "player_name": "Tyrese Haliburton",
-                "field_goals_made": 10,
-                "field_goals_attempted": 20,
-                "field_goal_percentage": 50,
-                "three_pointers_made": 5,
-                "three_pointers_attempted": 9,
-                "three_point_percentage": 55.56,
-                "free_throws_made": 4,
-                "free_throws_attempted": 4,
-                "free_throw_percentage": 100,
-                "offensive_rebounds": 1,
-                "defensive_rebounds": 3,
-                "rebounds": 4,
-                "assists": 8,
-                "steals": 2,
-                "blocks": 0,
-                "turnovers": 0,
-                "points": 29
-            }
-        )
-    ]
-)
-class StatsSerializer(serializers.HyperlinkedModelSerializer):
+class StatLineSerializer(serializers.HyperlinkedModelSerializer):
     game_info = serializers.SerializerMethodField()
     player_name = serializers.ReadOnlyField(source='player.name')
     field_goal_percentage = serializers.SerializerMethodField()
@@ -590,40 +567,53 @@ class StatsSerializer(serializers.HyperlinkedModelSerializer):
         else:
             return round((obj.free_throws_made/obj.free_throws_attempted) * 100, 2)
 
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            'Example Stats',
+            summary='An example statline',
+            value={
+                "url": "http://127.0.0.1:8000/stats/1/",
+                "id": 1,
+                "game": "http://127.0.0.1:8000/games/1/",
+                "game_info": "IND @ MIA - 2024-02-26 20:00:00+00:00",
+                "player": "http://127.0.0.1:8000/players/4/",
+                "player_name": "Tyrese Haliburton",
+                "field_goals_made": 10,
+                "field_goals_attempted": 20,
+                "field_goal_percentage": 50,
+                "three_pointers_made": 5,
+                "three_pointers_attempted": 9,
+                "three_point_percentage": 55.56,
+                "free_throws_made": 4,
+                "free_throws_attempted": 4,
+                "free_throw_percentage": 100,
+                "offensive_rebounds": 1,
+                "defensive_rebounds": 3,
+                "rebounds": 4,
+                "assists": 8,
+                "steals": 2,
+                "blocks": 0,
+                "turnovers": 0,
+                "points": 29
+            }
+        )
+    ]
+)
+class StatsSerializer(TimedRepresentationMixin, SparseFieldsetsMixin, StatLineSerializer):
     def validate(self, data):
         player = data['player']
         game = data['game']
-        fgm = data['field_goals_made']
-        fga = data['field_goals_attempted']
-        tpm = data['three_pointers_made']
-        tpa = data['three_pointers_attempted']
-        ftm = data['free_throws_made']
-        fta = data['free_throws_attempted']
 
         if Stats.objects.filter(game=game, player=player).exclude(
                 pk=self.instance.pk if self.instance else None
         ).exists():
             raise serializers.ValidationError('Cannot have two instances of stats of the same player in one game.')
 
-        if player.team != game.home_team and player.team != game.away_team:
-            raise serializers.ValidationError('This player is not in the team participating in the game.')
+        validate_player_in_game(player, game)
 
-        if fgm > fga or tpm > tpa or ftm > fta:
-            raise serializers.ValidationError(
-                "The number of shots made can't be greater than the number of shots attempted."
-            )
-
-        if tpa > fga:
-            raise serializers.ValidationError(
-                "The number of three pointers attempted can't be greater than the number of field goals attempted."
-            )
-
-        if tpm > fgm:
-            raise serializers.ValidationError(
-                "The number of three pointers made can't be greater than the number of field goals made."
-            )
-
-        return data
+        return validate_shot_counts(data)
 
     def validate_field_goals_made(self, value):
         return validate_nonnegative(value, 'The number of field goals made has to be non-negative.')
@@ -660,3 +650,377 @@ class StatsSerializer(serializers.HyperlinkedModelSerializer):
 
     def validate_turnovers(self, value):
         return validate_nonnegative(value, 'The number of turnovers has to be non-negative.')
+
+
+class BoxScoreLineSerializer(StatLineSerializer):
+    class Meta(StatLineSerializer.Meta):
+        fields = StatLineSerializer.Meta.fields[StatLineSerializer.Meta.fields.index('player'):]
+
+
+class BoxScoreTotalsSerializer(StatLineSerializer):
+    class Meta(StatLineSerializer.Meta):
+        fields = StatLineSerializer.Meta.fields[StatLineSerializer.Meta.fields.index('field_goals_made'):]
+
+
+class BoxScoreTeamSerializer(serializers.Serializer):
+    team = serializers.HyperlinkedRelatedField(view_name='team-detail', read_only=True)
+    name_abbreviation = serializers.CharField(source='team.name_abbreviation')
+    score = serializers.IntegerField()
+    players = BoxScoreLineSerializer(many=True)
+    totals = BoxScoreTotalsSerializer()
+
+
+class BoxScoreSerializer(TimedRepresentationMixin, serializers.Serializer):
+    game = serializers.HyperlinkedRelatedField(view_name='game-detail', read_only=True)
+    date = serializers.DateTimeField(source='game.date')
+    home_team = BoxScoreTeamSerializer()
+    away_team = BoxScoreTeamSerializer()
+
+
+class GameLogAveragesSerializer(serializers.Serializer):
+    points = serializers.FloatField()
+    rebounds = serializers.FloatField()
+    assists = serializers.FloatField()
+    steals = serializers.FloatField()
+    blocks = serializers.FloatField()
+    turnovers = serializers.FloatField()
+
+
+class GameLogEntrySerializer(StatsSerializer):
+    date = serializers.DateTimeField(source='game.date')
+    game_number = serializers.IntegerField()
+    last_5 = serializers.SerializerMethodField()
+    last_10 = serializers.SerializerMethodField()
+    season_to_date = serializers.SerializerMethodField()
+
+    class Meta(StatsSerializer.Meta):
+        fields = [
+            'game',
+            'game_info',
+            'date',
+            'game_number',
+            *StatsSerializer.Meta.fields[StatsSerializer.Meta.fields.index('field_goals_made'):],
+            'last_5',
+            'last_10',
+            'season_to_date',
+        ]
+
+    def get_window_averages(self, obj, window_name):
+        return {
+            stat_name: round(getattr(obj, f'{window_name}_{stat_name}'), 2)
+            for stat_name in StatsQuerySet.GAME_LOG_STATS
+        }
+
+    @extend_schema_field(GameLogAveragesSerializer)
+    def get_last_5(self, obj):
+        return self.get_window_averages(obj, 'last_5')
+
+    @extend_schema_field(GameLogAveragesSerializer)
+    def get_last_10(self, obj):
+        return self.get_window_averages(obj, 'last_10')
+
+    @extend_schema_field(GameLogAveragesSerializer)
+    def get_season_to_date(self, obj):
+        return self.get_window_averages(obj, 'season_to_date')
+
+
+class HyperlinkedIdField(serializers.HyperlinkedRelatedField):
+    def get_object(self, view_name, view_args, view_kwargs):
+        try:
+            return int(view_kwargs[self.lookup_url_kwarg])
+        except (TypeError, ValueError):
+            self.fail('does_not_exist')
+
+
+class BoxScoreListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        if not isinstance(data, list) or not data:
+            return super().to_internal_value(data)
+
+        statlines = []
+        errors = []
+
+        for item in data:
+            try:
+                statlines.append(self.child.run_validation(item))
+            except serializers.ValidationError as exc:
+                statlines.append(None)
+                errors.append(exc.detail)
+            else:
+                errors.append({})
+
+        game = self.context['game']
+        player_ids = [statline['player'] for statline in statlines if statline is not None]
+        players = Player.objects.in_bulk(player_ids)
+        players_with_stats = set(
+            Stats.objects.filter(game=game, player_id__in=player_ids).values_list('player_id', flat=True)
+        )
+
+        for index, statline in enumerate(statlines):
+            if statline is None:
+                continue
+
+            player = players.get(statline['player'])
+
+            try:
+                if player is None:
+                    raise serializers.ValidationError(
+                        {'player': [self.child.fields['player'].error_messages['does_not_exist']]}
+                    )
+
+                if player.id in players_with_stats:
+                    raise serializers.ValidationError(
+                        'Cannot have two instances of stats of the same player in one game.'
+                    )
+
+                validate_player_in_game(player, game)
+            except serializers.ValidationError as exc:
+                errors[index] = serializers.as_serializer_error(exc)
+            else:
+                statline['player'] = player
+                players_with_stats.add(player.id)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return statlines
+
+    def create(self, validated_data):
+        game = self.context['game']
+        statlines = Stats.objects.bulk_create(Stats(game=game, **statline) for statline in validated_data)
+        PlayerAverages.rebuild([statline.player_id for statline in statlines])
+        game.update_scores()
+        Player.objects.filter(pk__in=[statline.player_id for statline in statlines]).update(updated_at=game.updated_at)
+        Team.objects.filter(pk__in=[game.home_team_id, game.away_team_id]).update(updated_at=game.updated_at)
+        bump_stats_version()
+        bump_resource_versions({
+            'stats',
+            'games',
+            'players',
+            'teams',
+            f'game:{game.pk}',
+            f'team:{game.home_team_id}',
+            f'team:{game.away_team_id}',
+            *(f'player:{statline.player_id}' for statline in statlines),
+        })
+        return statlines
+
+
+class BoxScoreStatsSerializer(StatsSerializer):
+    player = HyperlinkedIdField(view_name='player-detail', queryset=Player.objects.all())
+
+    class Meta(StatsSerializer.Meta):
+        fields = [
+            'player',
+            'field_goals_made',
+            'field_goals_attempted',
+            'three_pointers_made',
+            'three_pointers_attempted',
+            'free_throws_made',
+            'free_throws_attempted',
+            'offensive_rebounds',
+            'defensive_rebounds',
+            'assists',
+            'steals',
+            'blocks',
+            'turnovers',
+        ]
+        list_serializer_class = BoxScoreListSerializer
+
+    def validate(self, data):
+        return validate_shot_counts(data)
+
+
+class ScheduleGameSerializer(serializers.Serializer):
+    date = serializers.DateTimeField()
+    home_team = HyperlinkedIdField(view_name='team-detail', queryset=Team.objects.all())
+    away_team = HyperlinkedIdField(view_name='team-detail', queryset=Team.objects.all())
+
+
+class ScheduleCheckSerializer(serializers.Serializer):
+    games = ScheduleGameSerializer(many=True, allow_empty=False)
+
+    def validate_games(self, value):
+        team_ids = {game['home_team'] for game in value} | {game['away_team'] for game in value}
+        existing_team_ids = set(Team.objects.filter(pk__in=team_ids).values_list('pk', flat=True))
+        if team_ids - existing_team_ids:
+            does_not_exist = ScheduleGameSerializer().fields['home_team'].error_messages['does_not_exist']
+            raise serializers.ValidationError([
+                {
+                    field: [does_not_exist]
+                    for field in ('home_team', 'away_team')
+                    if game[field] not in existing_team_ids
+                }
+                for game in value
+            ])
+
+        return value
+
+    def get_conflicts(self):
+        games = [
+            {'home_team_id': game['home_team'], 'away_team_id': game['away_team'], 'date': game['date']}
+            for game in self.validated_data['games']
+        ]
+        team_ids = {game['home_team_id'] for game in games} | {game['away_team_id'] for game in games}
+        existing_games = Game.objects.filter(
+            Q(home_team__in=team_ids) | Q(away_team__in=team_ids),
+            date__gte=min(game['date'] for game in games) - SCHEDULE_CONFLICT_WINDOW,
+            date__lte=max(game['date'] for game in games) + SCHEDULE_CONFLICT_WINDOW,
+        ).values('home_team_id', 'away_team_id', 'date')
+
+        return [
+            {'index': index, 'error': error}
+            for index, error in enumerate(find_schedule_conflicts(games, existing_games))
+            if error is not None
+        ]
+
+
+class ScheduleConflictSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    error = serializers.CharField()
+
+
+class ScheduleCheckResultSerializer(serializers.Serializer):
+    valid = serializers.BooleanField()
+    conflicts = ScheduleConflictSerializer(many=True)
+
+
+class LeaderboardQuerySerializer(serializers.Serializer):
+    stat = serializers.ChoiceField(choices=PlayerSerializer.averages_fields, default='points_per_game')
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+    min_games = serializers.IntegerField(min_value=1, default=1)
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            'Example Leaderboard Entry',
+            summary='An example leaderboard entry',
+            value={
+                "rank": 1,
+                "player": "http://127.0.0.1:8000/players/1/",
+                "player_id": 1,
+                "player_name": "Stephen Curry",
+                "team_name_abbreviation": "GSW",
+                "games_played": 2,
+                "value": 36.0
+            }
+        )
+    ]
+)
+class LeaderboardEntrySerializer(serializers.Serializer):
+    rank = serializers.IntegerField()
+    player = serializers.HyperlinkedRelatedField(view_name='player-detail', read_only=True)
+    player_id = serializers.IntegerField()
+    player_name = serializers.ReadOnlyField(source='player.name')
+    team_name_abbreviation = serializers.ReadOnlyField(source='player.team.name_abbreviation')
+    games_played = serializers.IntegerField()
+    value = serializers.SerializerMethodField()
+
+    @extend_schema_field(OpenApiTypes.FLOAT)
+    def get_value(self, obj):
+        return round(obj.stat_value, 2)
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            'Example Standings Entry',
+            summary='An example standings entry',
+            value={
+                "rank": 1,
+                "team": "http://127.0.0.1:8000/teams/1/",
+                "name_abbreviation": "MIA",
+                "full_name": "Miami Heat",
+                "wins": 3,
+                "losses": 1,
+                "win_percentage": 0.75,
+                "games_behind": 0.0,
+                "home_wins": 2,
+                "home_losses": 0,
+                "away_wins": 1,
+                "away_losses": 1,
+                "points_for": 448,
+                "points_against": 421,
+                "point_differential": 27
+            }
+        )
+    ]
+)
+class StandingsSerializer(serializers.HyperlinkedModelSerializer):
+    rank = serializers.IntegerField(read_only=True)
+    team = serializers.HyperlinkedIdentityField(view_name='team-detail')
+    wins = serializers.IntegerField(read_only=True)
+    losses = serializers.IntegerField(read_only=True)
+    win_percentage = serializers.FloatField(read_only=True)
+    games_behind = serializers.FloatField(read_only=True)
+    home_wins = serializers.IntegerField(read_only=True)
+    home_losses = serializers.IntegerField(read_only=True)
+    away_wins = serializers.IntegerField(read_only=True)
+    away_losses = serializers.IntegerField(read_only=True)
+    points_for = serializers.IntegerField(read_only=True)
+    points_against = serializers.IntegerField(read_only=True)
+    point_differential = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Team
+        fields = [
+            'rank',
+            'team',
+            'name_abbreviation',
+            'full_name',
+            'wins',
+            'losses',
+            'win_percentage',
+            'games_behind',
+            'home_wins',
+            'home_losses',
+            'away_wins',
+            'away_losses',
+            'points_for',
+            'points_against',
+            'point_differential',
+        ]
+
+
+class AdvancedMetricsQuerySerializer(serializers.Serializer):
+    stat = serializers.ChoiceField(choices=ADVANCED_METRICS, default='player_efficiency_rating')
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=100)
+    min_games = serializers.IntegerField(min_value=1, default=1)
+
+
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            'Example Advanced Metrics',
+            summary='An example of a player\'s advanced metrics',
+            value={
+                "player": "http://127.0.0.1:8000/players/1/",
+                "player_id": 1,
+                "player_name": "Jimmy Butler",
+                "team_name_abbreviation": "MIA",
+                "games_played": 2,
+                "true_shooting_percentage": 71.35,
+                "effective_field_goal_percentage": 64.29,
+                "assist_to_turnover_ratio": 0.67,
+                "usage_rate": 100.0,
+                "player_efficiency_rating": 18.1
+            }
+        )
+    ]
+)
+class AdvancedMetricsSerializer(serializers.Serializer):
+    player = serializers.HyperlinkedRelatedField(view_name='player-detail', read_only=True)
+    player_id = serializers.IntegerField()
+    player_name = serializers.ReadOnlyField(source='player.name')
+    team_name_abbreviation = serializers.ReadOnlyField(source='player.team.name_abbreviation')
+    games_played = serializers.IntegerField()
+    true_shooting_percentage = serializers.FloatField()
+    effective_field_goal_percentage = serializers.FloatField()
+    assist_to_turnover_ratio = serializers.FloatField()
+    usage_rate = serializers.FloatField()
+    player_efficiency_rating = serializers.FloatField()
+
+
+class AdvancedMetricsEntrySerializer(AdvancedMetricsSerializer):
+    rank = serializers.IntegerField()
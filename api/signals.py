@@ -0,0 +1,191 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
+from api.cache import bump_stats_version, bump_resource_versions, bump_league_version
+from api.models import Team, Coach, Player, Game, Stats, PlayerAverages
+
+
+def update_game_scores(game_ids):
+    games = list(Game.objects.filter(pk__in=game_ids))
+    for game in games:
+        game.update_scores()
+    return games
+
+
+def touch(queryset):
+    queryset.update(updated_at=timezone.now())
+
+
+def touch_teams(team_ids):
+    touch(Team.objects.filter(pk__in=[team_id for team_id in team_ids if team_id is not None]))
+
+
+def get_team_resources(team_ids):
+    return {'teams', *(f'team:{team_id}' for team_id in team_ids if team_id is not None)}
+
+
+def get_player_team_ids(player_ids):
+    return list(Player.objects.filter(pk__in=player_ids).values_list('team_id', flat=True))
+
+
+def get_game_resources(games):
+    resources = {'games', 'teams'}
+    for game in games:
+        resources.update([f'game:{game.pk}', f'team:{game.home_team_id}', f'team:{game.away_team_id}'])
+    return resources
+
+
+@receiver(pre_save, sender=Stats)
+def remember_previous_statline(sender, instance, **kwargs):
+    instance._previous_statline = Stats.objects.filter(pk=instance.pk).first() if instance.pk else None
+
+
+@receiver(post_save, sender=Stats)
+def update_read_models_on_stats_save(sender, instance, **kwargs):
+    previous_statline = getattr(instance, '_previous_statline', None)
+    affected_game_ids = {instance.game_id}
+    resources = {'stats', 'players', f'stats:{instance.pk}', f'player:{instance.player_id}'}
+
+    if previous_statline is not None:
+        PlayerAverages.apply_statline(previous_statline, -1)
+        affected_game_ids.add(previous_statline.game_id)
+        resources.add(f'player:{previous_statline.player_id}')
+
+    PlayerAverages.apply_statline(instance, 1)
+    games = update_game_scores(affected_game_ids)
+    player_team_ids = get_player_team_ids({instance.player_id, getattr(previous_statline, 'player_id', None)})
+    touch(Player.objects.filter(pk__in={instance.player_id, getattr(previous_statline, 'player_id', None)}))
+    touch_teams([*(team_id for game in games for team_id in (game.home_team_id, game.away_team_id)), *player_team_ids])
+    bump_stats_version()
+    bump_resource_versions(resources | get_game_resources(games) | get_team_resources(player_team_ids))
+
+
+@receiver(post_delete, sender=Stats)
+def update_read_models_on_stats_delete(sender, instance, **kwargs):
+    PlayerAverages.apply_statline(instance, -1)
+    games = update_game_scores([instance.game_id])
+    player_team_ids = get_player_team_ids([instance.player_id])
+    touch(Player.objects.filter(pk=instance.player_id))
+    touch_teams([*(team_id for game in games for team_id in (game.home_team_id, game.away_team_id)), *player_team_ids])
+    bump_stats_version()
+    bump_resource_versions(
+        {'stats', 'players', f'stats:{instance.pk}', f'player:{instance.player_id}'}
+        | get_game_resources(games)
+        | get_team_resources(player_team_ids)
+    )
+
+
+@receiver(pre_save, sender=Coach)
+@receiver(pre_save, sender=Player)
+def remember_previous_team(sender, instance, **kwargs):
+    instance._previous_team_id = (
+        sender.objects.filter(pk=instance.pk).values_list('team_id', flat=True).first() if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Coach)
+def invalidate_cached_team_on_coach_save(sender, instance, **kwargs):
+    previous_team_id = getattr(instance, '_previous_team_id', None)
+    touch_teams([instance.team_id, previous_team_id])
+    bump_resource_versions(get_team_resources([instance.team_id, previous_team_id]))
+
+
+@receiver(post_delete, sender=Coach)
+def invalidate_cached_team_on_coach_delete(sender, instance, **kwargs):
+    touch_teams([instance.team_id])
+    bump_resource_versions(get_team_resources([instance.team_id]))
+
+
+@receiver(post_save, sender=Player)
+def update_game_scores_on_team_change(sender, instance, created, **kwargs):
+    previous_team_id = getattr(instance, '_previous_team_id', None)
+    resources = {'players', f'player:{instance.pk}', *get_team_resources([instance.team_id, previous_team_id])}
+
+    touch_teams([instance.team_id, previous_team_id])
+
+    if not created and instance.team_id != previous_team_id:
+        update_game_scores(instance.stats.values('game_id'))
+
+    if not created:
+        touch(instance.stats.all())
+        touch(Game.objects.filter(stats__player=instance))
+        bump_stats_version()
+        resources.add('stats')
+        for statline in instance.stats.select_related('game'):
+            resources.add(f'stats:{statline.pk}')
+            resources.update(get_game_resources([statline.game]))
+
+    bump_resource_versions(resources)
+
+
+@receiver(post_delete, sender=Player)
+def invalidate_cached_team_on_player_delete(sender, instance, **kwargs):
+    touch_teams([instance.team_id])
+    bump_resource_versions({'players', f'player:{instance.pk}', *get_team_resources([instance.team_id])})
+
+
+@receiver(post_save, sender=Team)
+def invalidate_cached_stats_on_team_save(sender, instance, created, **kwargs):
+    if created:
+        bump_stats_version()
+        bump_resource_versions({'teams'})
+    else:
+        team_games = Game.objects.filter(Q(home_team=instance) | Q(away_team=instance))
+        touch(instance.players.all())
+        touch(instance.coach.all())
+        touch(team_games)
+        touch(Stats.objects.filter(game__in=team_games))
+        touch(Team.objects.filter(Q(home_games__away_team=instance) | Q(away_games__home_team=instance)))
+        bump_stats_version()
+        bump_league_version()
+
+
+@receiver(pre_delete, sender=Team)
+def remember_team_members(sender, instance, **kwargs):
+    instance._player_ids = list(instance.players.values_list('pk', flat=True))
+    instance._coach_ids = list(instance.coach.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Team)
+def invalidate_cached_league_on_team_delete(sender, instance, **kwargs):
+    player_ids = getattr(instance, '_player_ids', [])
+    touch(Player.objects.filter(pk__in=player_ids))
+    touch(Coach.objects.filter(pk__in=getattr(instance, '_coach_ids', [])))
+    bump_stats_version()
+    bump_league_version()
+    bump_resource_versions({'players', *(f'player:{player_id}' for player_id in player_ids)})
+
+
+@receiver(pre_save, sender=Game)
+def remember_previous_game(sender, instance, **kwargs):
+    instance._previous_game = Game.objects.filter(pk=instance.pk).first() if instance.pk else None
+
+
+@receiver(post_save, sender=Game)
+def update_game_scores_on_game_save(sender, instance, created, **kwargs):
+    previous_game = getattr(instance, '_previous_game', None)
+    resources = get_game_resources([instance])
+
+    touch_teams([instance.home_team_id, instance.away_team_id])
+
+    if not created:
+        instance.update_scores()
+        touch(instance.stats.all())
+        resources.add('stats')
+        for stats_id, player_id in instance.stats.values_list('pk', 'player_id'):
+            resources.update([f'stats:{stats_id}', f'player:{player_id}'])
+
+    if previous_game is not None:
+        touch_teams([previous_game.home_team_id, previous_game.away_team_id])
+        resources.update(get_game_resources([previous_game]))
+
+    bump_stats_version()
+    bump_resource_versions(resources)
+
+
+@receiver(post_delete, sender=Game)
+def invalidate_cached_stats_on_game_delete(sender, instance, **kwargs):
+    touch_teams([instance.home_team_id, instance.away_team_id])
+    bump_stats_version()
+    bump_resource_versions(get_game_resources([instance]))
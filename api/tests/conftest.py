@@ -1,10 +1,17 @@
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import RequestFactory
 from rest_framework.test import APIClient
 from api.models import Team, Coach, Player, Game, Stats
 
 
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    settings.API_CACHE_ENABLED = True
+    cache.clear()
+
+
 @pytest.fixture
 def create_superuser():
     return User.objects.create_superuser(
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from api.advanced import (
+    STATLINE_COLUMNS,
+    compute_advanced_metrics,
+    compute_player_advanced_metrics,
+    load_statlines,
+    get_advanced_metrics,
+    get_player_advanced_metrics,
+)
+
+
+def make_statline(player_id, team_id, game_id, **stats):
+    return [player_id, team_id, game_id, *(stats.get(column, 0) for column in STATLINE_COLUMNS[3:])]
+
+
+class TestAdvancedMetrics:
+    @pytest.mark.django_db
+    def test_load_statlines(self, create_first_statline, create_second_statline):
+        statlines = load_statlines()
+        assert statlines.shape == (2, len(STATLINE_COLUMNS))
+        assert sorted(statlines[:, 0].tolist()) == [create_first_statline.player_id, create_second_statline.player_id]
+
+    @pytest.mark.django_db
+    def test_traded_player_lines_need_a_game_side(
+            self,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline,
+            create_third_team
+    ):
+        traded_player = create_first_statline.player
+        traded_player.team = create_third_team
+        traded_player.save()
+        metrics = compute_advanced_metrics(load_statlines())
+        assert metrics[traded_player.pk]['games_played'] == 1
+        assert metrics[create_second_statline.player_id]['usage_rate'] == 100.0
+
+    @pytest.mark.django_db
+    def test_teamless_lines_are_not_merged(self, create_first_statline, create_second_statline):
+        for statline in (create_first_statline, create_second_statline):
+            statline.player.team = None
+            statline.player.save()
+        assert load_statlines().shape == (0, len(STATLINE_COLUMNS))
+
+    @pytest.mark.django_db
+    def test_shooting_and_ratios(self, create_first_statline, create_second_statline, create_third_statline):
+        metrics = compute_advanced_metrics(load_statlines())[create_first_statline.player_id]
+        assert metrics['games_played'] == 2
+        assert metrics['true_shooting_percentage'] == 71.35
+        assert metrics['effective_field_goal_percentage'] == 64.29
+        assert metrics['assist_to_turnover_ratio'] == 0.67
+
+    @pytest.mark.django_db
+    def test_per_is_normalized_to_league_average(
+            self,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline
+    ):
+        metrics = compute_advanced_metrics(load_statlines()).values()
+        weighted_per = sum(player['player_efficiency_rating'] * player['games_played'] for player in metrics)
+        assert weighted_per / sum(player['games_played'] for player in metrics) == pytest.approx(15, abs=0.01)
+        assert len({player['player_efficiency_rating'] for player in metrics}) == 2
+
+    def test_usage_rate_is_share_of_team_plays(self):
+        statlines = np.array([
+            make_statline(1, 1, 1, field_goals_attempted=10),
+            make_statline(2, 1, 1, field_goals_attempted=5, turnovers=5),
+            make_statline(3, 2, 1, field_goals_attempted=4, free_throws_attempted=25),
+        ])
+        metrics = compute_advanced_metrics(statlines)
+        assert [metrics[player_id]['usage_rate'] for player_id in (1, 2, 3)] == [50.0, 50.0, 100.0]
+        assert metrics[2]['assist_to_turnover_ratio'] == 0.0
+
+    def test_no_statlines(self):
+        assert compute_advanced_metrics(np.empty((0, len(STATLINE_COLUMNS)), dtype=np.int64)) == {}
+
+    @pytest.mark.django_db
+    def test_player_metrics_match_league_metrics(
+            self,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline,
+            settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        league_metrics = compute_advanced_metrics(load_statlines())
+        assert len(league_metrics) == 2
+        for player_id, metrics in league_metrics.items():
+            assert compute_player_advanced_metrics(player_id) == metrics
+
+    @pytest.mark.django_db
+    def test_player_without_statlines(self, create_first_player):
+        assert get_player_advanced_metrics(create_first_player.pk) == {
+            'player_id': create_first_player.pk,
+            'games_played': 0,
+            'true_shooting_percentage': 0.0,
+            'effective_field_goal_percentage': 0.0,
+            'assist_to_turnover_ratio': 0.0,
+            'usage_rate': 0.0,
+            'player_efficiency_rating': 0.0,
+        }
+
+    @pytest.mark.django_db
+    def test_cached_per_stats_version(
+            self,
+            create_first_statline,
+            django_assert_num_queries,
+            django_capture_on_commit_callbacks
+    ):
+        get_advanced_metrics()
+        with django_assert_num_queries(0):
+            first_metrics = get_advanced_metrics()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_statline.field_goals_made = 0
+            create_first_statline.three_pointers_made = 0
+            create_first_statline.save()
+
+        second_metrics = get_advanced_metrics()
+        player_id = create_first_statline.player_id
+        assert first_metrics[player_id]['effective_field_goal_percentage'] == 43.75
+        assert second_metrics[player_id]['effective_field_goal_percentage'] == 0.0
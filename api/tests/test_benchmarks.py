@@ -0,0 +1,105 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.urls import resolve
+from api.benchmarks import seed_league, get_benchmark_endpoints, compare_with_baseline
+from api.models import Team, Player, Game, Stats
+from api.urls import urlpatterns
+
+
+class TestSeedLeague:
+    @pytest.mark.django_db
+    def test_seed_league_is_deterministic(self):
+        dataset = seed_league(seed=1, team_count=4, players_per_team=6, games_per_team=6, players_per_game=5)
+        first_points = list(Stats.objects.order_by('pk').values_list('field_goals_made', 'free_throws_made'))
+        Team.objects.all().delete()
+        seed_league(seed=1, team_count=4, players_per_team=6, games_per_team=6, players_per_game=5)
+        second_points = list(Stats.objects.order_by('pk').values_list('field_goals_made', 'free_throws_made'))
+
+        assert dataset == {'teams': 4, 'players': 24, 'games': 12, 'stats': 120}
+        assert first_points == second_points
+
+    @pytest.mark.django_db
+    def test_seed_league_schedule(self):
+        seed_league(team_count=6, players_per_team=6, games_per_team=10, players_per_game=5)
+        for team in Team.objects.all():
+            assert Game.objects.filter(home_team=team).count() + Game.objects.filter(away_team=team).count() == 10
+        assert not Game.objects.filter(home_team_score=0, away_team_score=0).exists()
+
+
+class TestBenchmarkCommand:
+    @pytest.mark.django_db
+    def test_benchmark_endpoints_cover_get_routes(self):
+        seed_league(team_count=4, players_per_team=6, games_per_team=3, players_per_game=5)
+        endpoints = get_benchmark_endpoints(urlpatterns)
+        assert {
+            'team-list',
+            'team-detail',
+            'team-player-list',
+            'team-coach-detail',
+            'game-stats-detail',
+            'game-box-score',
+            'player-game-log',
+            'leaderboard-list',
+            'standings-list',
+        } <= set(endpoints)
+
+    @pytest.mark.django_db
+    def test_benchmark_command(self, tmp_path):
+        output_file = tmp_path / 'benchmark.json'
+        options = {
+            'teams': 4,
+            'players_per_team': 6,
+            'games_per_team': 3,
+            'players_per_game': 5,
+            'iterations': 2,
+            'warmup': 0,
+            'endpoint': ['team-list', 'game-box-score'],
+            'stdout': StringIO(),
+        }
+        call_command('benchmark', output=str(output_file), **options)
+        report = json.loads(output_file.read_text())
+
+        assert not Team.objects.exists()
+        assert set(report['endpoints']) == {'team-list', 'game-box-score'}
+        assert report['endpoints']['game-box-score']['queries'] == 4
+
+        report['endpoints']['team-list']['queries'] = 0
+        output_file.write_text(json.dumps(report))
+        with pytest.raises(CommandError):
+            call_command('benchmark', baseline=str(output_file), **options)
+
+    @pytest.mark.django_db
+    def test_benchmark_command_connections(self, tmp_path):
+        output_file = tmp_path / 'benchmark.json'
+        connection_settings = {key: connection.settings_dict[key] for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS')}
+        call_command(
+            'benchmark',
+            teams=2,
+            players_per_team=5,
+            games_per_team=1,
+            players_per_game=5,
+            iterations=2,
+            warmup=0,
+            endpoint=['team-list'],
+            connections=True,
+            output=str(output_file),
+            stdout=StringIO(),
+        )
+        report = json.loads(output_file.read_text())
+
+        coach_url = report['connections']['persistent']['url']
+        assert set(report['connections']) == {'per_request', 'persistent'}
+        assert resolve(coach_url).url_name == 'team-coach-list'
+        assert not Team.objects.exists()
+        assert not Player.objects.exists()
+        assert not Stats.objects.exists()
+        assert {key: connection.settings_dict[key] for key in connection_settings} == connection_settings
+
+    def test_compare_with_baseline(self):
+        baseline = {'team-list': {'p50_ms': 10.0, 'queries': 5, 'peak_memory_kb': 100.0}}
+        results = {'team-list': {'p50_ms': 11.0, 'queries': 5, 'peak_memory_kb': 130.0}}
+        assert compare_with_baseline(results, baseline, 0.2) == ['team-list: peak memory 100.0 KB -> 130.0 KB']
@@ -0,0 +1,101 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from api.models import Team, Player, Game, Stats
+
+
+class TestImportSeasonCommand:
+    @pytest.mark.django_db
+    @pytest.mark.skipif(connection.vendor == 'postgresql', reason='checks the non-PostgreSQL error')
+    def test_import_season_requires_postgresql(self, tmp_path):
+        teams_file = tmp_path / 'teams.csv'
+        teams_file.write_text('name_abbreviation,full_name\nMIA,Miami Heat\n')
+        with pytest.raises(CommandError):
+            call_command('import_season', teams=str(teams_file), stdout=StringIO())
+
+    @pytest.mark.django_db
+    @pytest.mark.skipif(connection.vendor != 'postgresql', reason='COPY requires PostgreSQL')
+    def test_import_season(self, tmp_path, create_first_team):
+        teams_file = tmp_path / 'teams.csv'
+        teams_file.write_text(
+            'name_abbreviation,full_name\n'
+            'GSW,Golden State Warriors\n'
+            'gsw,Golden State\n'
+            'MIA,Miami Sun\n'
+            'BOS,Miami Sun\n'
+        )
+        players_file = tmp_path / 'players.csv'
+        players_file.write_text(
+            'id,name,team_name_abbreviation,date_of_birth,country,position,height,weight,jersey_number\n'
+            '1,Jimmy Butler,MIA,1988-01-01,USA,SF,201,100,22\n'
+            '2,Stephen Curry,GSW,1988-03-14,USA,PG,188,84,30\n'
+            '3,Klay Thompson,GSW,1990-02-08,USA,SG,198,98,30\n'
+            '4,Nobody,XXX,,USA,C,210,110,\n'
+        )
+        games_file = tmp_path / 'games.ndjson'
+        games_file.write_text(
+            json.dumps({
+                'id': 10,
+                'date': '2024-01-01T20:00:00Z',
+                'home_team_name_abbreviation': 'MIA',
+                'away_team_name_abbreviation': 'GSW',
+            }) + '\n' + json.dumps({
+                'id': 11,
+                'date': '2024-01-01T21:00:00Z',
+                'home_team_name_abbreviation': 'GSW',
+                'away_team_name_abbreviation': 'MIA',
+            }) + '\n'
+        )
+        statline = '2,5,1,3,2,2,1,4,5,1,0,3'
+        stats_file = tmp_path / 'stats.csv'
+        stats_file.write_text(
+            'game_id,player_id,field_goals_made,field_goals_attempted,three_pointers_made,three_pointers_attempted,'
+            'free_throws_made,free_throws_attempted,offensive_rebounds,defensive_rebounds,assists,steals,blocks,'
+            'turnovers\n'
+            f'10,1,{statline}\n'
+            f'10,2,{statline}\n'
+            f'10,2,{statline}\n'
+            f'11,1,{statline}\n'
+            f'10,3,{statline}\n'
+            '10,1,1,0,0,0,0,0,0,0,0,0,0,0\n'
+        )
+        rejected_file = tmp_path / 'rejected.ndjson'
+
+        call_command(
+            'import_season',
+            teams=str(teams_file),
+            players=str(players_file),
+            games=str(games_file),
+            stats=str(stats_file),
+            rejected=str(rejected_file),
+            stdout=StringIO(),
+        )
+
+        assert Team.objects.count() == 3
+        assert Team.objects.filter(name_abbreviation='BOS', full_name='Miami Sun').exists()
+        assert Player.objects.count() == 2
+        assert Game.objects.count() == 1
+        assert Stats.objects.count() == 2
+
+        game = Game.objects.get()
+        assert game.home_team_score == 7
+        assert game.away_team_score == 7
+        curry = Player.objects.get(name='Stephen Curry')
+        assert curry.averages.games_played == 1
+        assert curry.averages.points_total == 7
+
+        rejected = [json.loads(line) for line in rejected_file.read_text().splitlines()]
+        assert [(rejection['file'], rejection['row']) for rejection in rejected] == [
+            ('teams', 2),
+            ('teams', 3),
+            ('players', 3),
+            ('players', 4),
+            ('games', 2),
+            ('stats', 3),
+            ('stats', 4),
+            ('stats', 5),
+            ('stats', 6),
+        ]
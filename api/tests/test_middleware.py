@@ -0,0 +1,48 @@
+import json
+import logging
+import pytest
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+
+
+class TestRequestMetricsMiddleware:
+    @pytest.mark.django_db
+    def test_disabled_by_default(self, api_client, create_first_team):
+        response = api_client.get(reverse('team-list'))
+        assert 'Server-Timing' not in response
+
+    @pytest.mark.django_db
+    def test_server_timing_header(self, api_client, settings, create_first_player):
+        settings.REQUEST_METRICS_ENABLED = True
+        response = api_client.get(reverse('player-list'))
+        metrics = {metric.split(';')[0]: metric for metric in response['Server-Timing'].split(', ')}
+        assert set(metrics) == {'db', 'serializer', 'view', 'total'}
+        assert 'desc="1 queries"' in metrics['db']
+
+    @pytest.mark.django_db
+    def test_server_timing_header_async(self, async_client, settings, create_first_player):
+        settings.REQUEST_METRICS_ENABLED = True
+        response = async_to_sync(async_client.get)(reverse('player-list'))
+        assert 'desc="1 queries"' in response['Server-Timing']
+
+    @pytest.mark.django_db
+    def test_structured_log_line(self, api_client, settings, caplog, create_first_player):
+        settings.REQUEST_METRICS_ENABLED = True
+        with caplog.at_level(logging.INFO, logger='api.requests'):
+            api_client.get(reverse('player-detail', args=[create_first_player.id]))
+        request_metrics = json.loads(caplog.records[-1].getMessage())
+        assert caplog.records[-1].levelno == logging.INFO
+        assert request_metrics['path'] == reverse('player-detail', args=[create_first_player.id])
+        assert request_metrics['status'] == 200
+        assert request_metrics['queries'] == 2
+        assert request_metrics['over_budget'] == []
+
+    @pytest.mark.django_db
+    def test_over_budget(self, api_client, settings, caplog, create_first_player):
+        settings.REQUEST_METRICS_ENABLED = True
+        settings.REQUEST_METRICS_QUERY_BUDGET = 0
+        with caplog.at_level(logging.INFO, logger='api.requests'):
+            response = api_client.get(reverse('player-list'))
+        assert 'budget;desc="exceeded: queries"' in response['Server-Timing']
+        assert caplog.records[-1].levelno == logging.WARNING
+        assert json.loads(caplog.records[-1].getMessage())['over_budget'] == ['queries']
@@ -1,4 +1,7 @@
 import pytest
+from io import StringIO
+from django.core.management import call_command
+from api.models import Game, PlayerAverages
 
 
 class TestTeamModel:
@@ -34,3 +37,115 @@ class TestStatsModel:
     def test_stats_str_method(self, create_first_statline):
         stats = create_first_statline
         assert str(stats) == 'GSW @ MIA - 2024-01-01 - Jimmy Butler - DOB: 1988-01-01 stats'
+
+
+class TestPlayerAveragesModel:
+    @pytest.mark.django_db
+    def test_player_averages_follow_statlines(self, create_first_player, create_first_statline, create_third_statline):
+        averages = PlayerAverages.objects.get(player=create_first_player)
+        assert averages.games_played == 2
+        assert averages.points_total == 25
+        assert averages.rebounds_total == 15
+
+        create_third_statline.three_pointers_made = 0
+        create_third_statline.save()
+        averages.refresh_from_db()
+        assert averages.games_played == 2
+        assert averages.points_total == 24
+
+        create_first_statline.delete()
+        averages.refresh_from_db()
+        assert averages.games_played == 1
+        assert averages.points_total == 13
+        assert averages.rebounds_total == 2
+
+    @pytest.mark.django_db
+    def test_player_averages_rebuild_command(self, create_first_player, create_first_statline, create_third_statline):
+        PlayerAverages.objects.filter(player=create_first_player).update(games_played=0, points_total=0)
+        call_command('rebuild_player_averages', stdout=StringIO())
+        averages = PlayerAverages.objects.get(player=create_first_player)
+        assert averages.games_played == 2
+        assert averages.points_total == 25
+
+    @pytest.mark.django_db
+    def test_player_averages_rebuild_command_for_given_players(
+            self,
+            create_first_player,
+            create_second_player,
+            create_first_statline,
+            create_second_statline
+    ):
+        PlayerAverages.objects.update(games_played=0, points_total=0)
+        output = StringIO()
+        call_command('rebuild_player_averages', create_second_player.pk, stdout=output)
+        assert PlayerAverages.objects.get(player=create_first_player).points_total == 0
+        assert PlayerAverages.objects.get(player=create_second_player).points_total == 14
+        assert 'Rebuilt averages for 1 players.' in output.getvalue()
+
+
+class TestGameScores:
+    @pytest.mark.django_db
+    def test_game_scores_follow_statlines(self, create_first_game, create_first_statline, create_second_statline):
+        create_first_game.refresh_from_db()
+        assert create_first_game.home_team_score == 11
+        assert create_first_game.away_team_score == 14
+
+        create_second_statline.delete()
+        create_first_game.refresh_from_db()
+        assert create_first_game.home_team_score == 11
+        assert create_first_game.away_team_score == 0
+
+    @pytest.mark.django_db
+    def test_game_scores_follow_player_team_change(
+            self,
+            create_first_game,
+            create_first_player,
+            create_second_team,
+            create_first_statline
+    ):
+        create_first_player.team = create_second_team
+        create_first_player.save()
+        create_first_game.refresh_from_db()
+        assert create_first_game.home_team_score == 0
+        assert create_first_game.away_team_score == 11
+
+    @pytest.mark.django_db
+    def test_game_scores_rebuild_command(self, create_first_game, create_first_statline):
+        Game.objects.filter(pk=create_first_game.pk).update(home_team_score=0)
+        call_command('rebuild_game_scores', stdout=StringIO())
+        create_first_game.refresh_from_db()
+        assert create_first_game.home_team_score == 11
+
+
+class TestUpdatedAt:
+    @pytest.mark.django_db
+    def test_stats_write_touches_parents(self, create_first_statline):
+        game = create_first_statline.game
+        player = create_first_statline.player
+        previous_timestamps = [game.updated_at, player.updated_at, game.home_team.updated_at, game.away_team.updated_at]
+
+        create_first_statline.assists = 10
+        create_first_statline.save()
+
+        for instance in (game, player, game.home_team, game.away_team):
+            instance.refresh_from_db()
+        assert all(
+            timestamp > previous_timestamp
+            for timestamp, previous_timestamp in zip(
+                [game.updated_at, player.updated_at, game.home_team.updated_at, game.away_team.updated_at],
+                previous_timestamps,
+            )
+        )
+
+    @pytest.mark.django_db
+    def test_stats_delete_touches_traded_players_team(self, create_first_statline, create_third_team):
+        player = create_first_statline.player
+        player.team = create_third_team
+        player.save()
+        create_third_team.refresh_from_db()
+        previous_timestamp = create_third_team.updated_at
+
+        create_first_statline.delete()
+
+        create_third_team.refresh_from_db()
+        assert create_third_team.updated_at > previous_timestamp
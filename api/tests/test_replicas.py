@@ -0,0 +1,97 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import router
+from django.http import HttpResponse
+from api.cache import get_or_compute_response
+from api.middleware import PRIMARY_COOKIE, ReplicaRoutingMiddleware
+from api.models import Team
+from api.replicas import current_read_database
+from api.views import TeamViewSet
+
+
+@pytest.fixture
+def read_from_replica():
+    token = current_read_database.set('replica_0')
+    yield
+    current_read_database.reset(token)
+
+
+@pytest.fixture
+def replica_settings(settings):
+    settings.DATABASE_REPLICAS = ['replica_0']
+    settings.REPLICA_STICKY_SECONDS = 5
+    return settings
+
+
+def get_read_database(request, view):
+    read_databases = []
+
+    def get_response(request):
+        middleware.process_view(request, view, (), {})
+        read_databases.append(router.db_for_read(Team))
+        return HttpResponse()
+
+    middleware = ReplicaRoutingMiddleware(get_response)
+    response = middleware(request)
+    assert current_read_database.get() is None
+    return read_databases[0], response
+
+
+def count_computations():
+    computations = []
+
+    def compute():
+        computations.append('teams')
+        return computations
+
+    for _ in range(2):
+        get_or_compute_response(['teams'], 'http://testserver/teams/', compute)
+    return len(computations)
+
+
+class TestReplicaRouter:
+    def test_reads_follow_current_read_database(self, read_from_replica):
+        assert router.db_for_read(Team) == 'replica_0'
+        assert router.db_for_read(User) == 'default'
+        assert router.db_for_write(Team) == 'default'
+
+    def test_reads_default_to_primary(self):
+        assert router.db_for_read(Team) == 'default'
+
+    def test_replicas_are_not_migrated(self, replica_settings):
+        assert not router.allow_migrate('replica_0', 'api')
+        assert router.allow_migrate('default', 'api')
+
+
+class TestReplicaRoutingMiddleware:
+    def test_safe_api_request_reads_from_replica(self, rf, replica_settings):
+        read_database, response = get_read_database(rf.get('/teams/'), TeamViewSet.as_view({'get': 'list'}))
+        assert read_database == 'replica_0'
+        assert PRIMARY_COOKIE not in response.cookies
+
+    def test_write_pins_client_to_primary(self, rf, replica_settings):
+        read_database, response = get_read_database(rf.post('/teams/'), TeamViewSet.as_view({'post': 'create'}))
+        assert read_database == 'default'
+        assert response.cookies[PRIMARY_COOKIE]['max-age'] == 5
+
+    def test_pinned_client_reads_from_primary(self, rf, replica_settings):
+        request = rf.get('/teams/')
+        request.COOKIES[PRIMARY_COOKIE] = '1'
+        read_database, _ = get_read_database(request, TeamViewSet.as_view({'get': 'list'}))
+        assert read_database == 'default'
+
+    def test_non_api_view_reads_from_primary(self, rf, replica_settings):
+        read_database, _ = get_read_database(rf.get('/admin/'), lambda request: HttpResponse())
+        assert read_database == 'default'
+
+
+class TestReplicaCaching:
+    def test_recent_write_not_cached_from_replica(self, replica_settings, read_from_replica):
+        assert count_computations() == 2
+
+    def test_settled_write_cached_from_replica(self, replica_settings, read_from_replica):
+        replica_settings.REPLICA_STICKY_SECONDS = 0
+        assert count_computations() == 1
+
+    def test_primary_reads_cached(self, replica_settings):
+        assert count_computations() == 1
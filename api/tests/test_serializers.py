@@ -783,6 +783,24 @@ class TestGameSerializer:
         assert not serializer.is_valid()
         assert 'Away team has another game around the same time.' in serializer.errors['non_field_errors']
 
+    @pytest.mark.django_db
+    def test_game_conflicts_checked_in_one_query(
+            self,
+            create_first_team,
+            create_third_team,
+            create_first_game,
+            django_assert_num_queries
+    ):
+        data = {
+            'date': '2024-01-01 03:00:00',
+            'home_team': reverse('team-detail', args=[create_first_team.id]),
+            'away_team': reverse('team-detail', args=[create_third_team.id]),
+        }
+
+        serializer = GameSerializer(data=data)
+        with django_assert_num_queries(3):
+            assert serializer.is_valid()
+
 
 class TestStatsSerializer:
     @pytest.mark.django_db
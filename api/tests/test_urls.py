@@ -54,6 +54,16 @@ class TestBasicRouter:
         response = api_client.get(reverse('stats-detail', args=[create_first_statline.id]))
         assert response.status_code == status.HTTP_200_OK
 
+    @pytest.mark.django_db
+    def test_leaderboards_url(self, api_client):
+        response = api_client.get(reverse('leaderboard-list'))
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.django_db
+    def test_standings_url(self, api_client):
+        response = api_client.get(reverse('standings-list'))
+        assert response.status_code == status.HTTP_200_OK
+
 
 class TestTeamRouter:
     @pytest.mark.django_db
@@ -1,7 +1,13 @@
+import csv
+import io
+import json
 import pytest
-from django.urls import reverse
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.management import call_command
+from django.urls import resolve, reverse
+from django.utils.http import http_date
 from rest_framework import status
-from api.models import Player
+from api.models import Team, Player, Game, Stats, PlayerAverages
 
 
 class TestTeamViewSet:
@@ -9,7 +15,46 @@ class TestTeamViewSet:
     def test_list_teams(self, api_client, create_first_team, create_second_team):
         response = api_client.get(reverse('team-list'))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
+
+    @pytest.mark.django_db
+    def test_list_teams_constant_queries(
+            self,
+            api_client,
+            create_first_coach,
+            create_first_player,
+            create_second_player,
+            create_first_game,
+            create_second_game,
+            django_assert_num_queries
+    ):
+        with django_assert_num_queries(5):
+            response = api_client.get(reverse('team-list'))
+        first_team_data = next(
+            team_data for team_data in response.data['results'] if team_data['name_abbreviation'] == 'MIA'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert first_team_data['coach']['name'] == create_first_coach.name
+        assert [player_data['id'] for player_data in first_team_data['players']] == [create_first_player.id]
+        assert [game_data['id'] for game_data in first_team_data['games']] == [
+            create_first_game.id,
+            create_second_game.id,
+        ]
+        assert first_team_data['games'][0]['info'] == 'GSW @ MIA - 2024-01-01T00:00:00Z'
+
+    @pytest.mark.django_db
+    def test_list_teams_sparse_fieldset(
+            self,
+            api_client,
+            create_first_coach,
+            create_first_player,
+            create_first_game,
+            django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse('team-list'), {'fields': 'id,name_abbreviation'})
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data['results'][0]) == {'id', 'name_abbreviation'}
 
     @pytest.mark.django_db
     def test_retrieve_team(self, api_client, create_first_team):
@@ -59,7 +104,7 @@ class TestCoachViewSet:
     def test_list_coaches(self, api_client, create_first_coach, create_second_coach):
         response = api_client.get(reverse('coach-list'))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
 
     @pytest.mark.django_db
     def test_list_coaches_specific_team(self, api_client, create_first_team, create_first_coach, create_second_coach):
@@ -67,7 +112,7 @@ class TestCoachViewSet:
         team_coach_url = f'{team_url}coach/'
         response = api_client.get(team_coach_url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data['results']) == 1
 
     @pytest.mark.django_db
     def test_retrieve_coach(self, api_client, create_first_coach):
@@ -117,7 +162,7 @@ class TestPlayerViewSet:
     def test_list_players(self, api_client, create_first_player, create_second_player):
         response = api_client.get(reverse('player-list'))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
 
     @pytest.mark.django_db
     def test_list_players_specific_team(self, api_client, create_first_team, create_first_player, create_second_player):
@@ -125,7 +170,59 @@ class TestPlayerViewSet:
         team_players_url = f'{team_url}players/'
         response = api_client.get(team_players_url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data['results']) == 1
+
+    @pytest.mark.django_db
+    def test_list_players_per_game_stats(
+            self,
+            api_client,
+            create_first_player,
+            create_second_player,
+            create_first_statline,
+            create_third_statline
+    ):
+        response = api_client.get(reverse('player-list'))
+        first_player_data = next(
+            player_data for player_data in response.data['results'] if player_data['id'] == create_first_player.id
+        )
+        second_player_data = next(
+            player_data for player_data in response.data['results'] if player_data['id'] == create_second_player.id
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert first_player_data['points_per_game'] == 12.5
+        assert first_player_data['rebounds_per_game'] == 7.5
+        assert first_player_data['field_goal_percentage'] == 57.14
+        assert first_player_data['free_throw_percentage'] == 87.5
+        assert second_player_data['points_per_game'] == 0.0
+        assert second_player_data['field_goal_percentage'] == 0.0
+
+    @pytest.mark.django_db
+    def test_list_players_sparse_fieldset(self, api_client, create_first_player, create_first_statline):
+        response = api_client.get(reverse('player-list'), {'fields': 'id,name,position,points_per_game'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0] == {
+            'id': create_first_player.id,
+            'name': create_first_player.name,
+            'position': create_first_player.position,
+            'points_per_game': 11.0,
+        }
+
+    @pytest.mark.django_db
+    def test_create_player_ignores_sparse_fieldset(self, api_client, create_first_team, create_superuser):
+        api_client.force_authenticate(user=create_superuser)
+        data = {
+            'name': 'Bam Adebayo',
+            'team': reverse('team-detail', args=[create_first_team.id]),
+            'date_of_birth': '1997-01-01',
+            'country': 'USA',
+            'position': 'C',
+            'height': 208,
+            'weight': 110,
+            'jersey_number': 13,
+        }
+        response = api_client.post(f'{reverse("player-list")}?fields=id', data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Player.objects.get(pk=response.data['id']).jersey_number == 13
 
     @pytest.mark.django_db
     def test_retrieve_player(self, api_client, create_first_player):
@@ -211,7 +308,7 @@ class TestGameViewSet:
     def test_list_games(self, api_client, create_first_game, create_second_game):
         response = api_client.get(reverse('game-list'))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
 
     @pytest.mark.django_db
     def test_list_games_specific_team(self, api_client, create_second_team, create_first_game, create_second_game):
@@ -219,7 +316,47 @@ class TestGameViewSet:
         team_games_url = f'{team_url}games/'
         response = api_client.get(team_games_url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data['results']) == 1
+
+    @pytest.mark.django_db
+    def test_list_games_constant_queries(
+            self,
+            api_client,
+            create_second_team,
+            create_first_game,
+            create_second_game,
+            create_first_statline,
+            create_second_statline,
+            django_assert_num_queries
+    ):
+        team_url = reverse('team-detail', args=[create_second_team.id])
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse('game-list'))
+        with django_assert_num_queries(1):
+            api_client.get(f'{team_url}games/')
+        first_game_data = next(
+            game_data for game_data in response.data['results'] if game_data['id'] == create_first_game.id
+        )
+        assert first_game_data['home_team_score'] == 11
+        assert first_game_data['away_team_score'] == 14
+
+    @pytest.mark.django_db
+    def test_list_games_cursor_pagination(self, api_client, create_first_team, create_second_team, create_first_game):
+        later_game = Game.objects.create(date='2024-03-01', home_team=create_second_team, away_team=create_first_team)
+        earlier_game = Game.objects.create(date='2023-12-01', home_team=create_second_team, away_team=create_first_team)
+        first_page = api_client.get(reverse('game-list'), {'page_size': 2})
+        second_page = api_client.get(first_page.data['next'])
+        assert [game_data['id'] for game_data in first_page.data['results']] == [earlier_game.id, create_first_game.id]
+        assert [game_data['id'] for game_data in second_page.data['results']] == [later_game.id]
+        assert second_page.data['next'] is None
+
+    @pytest.mark.django_db
+    def test_list_games_omitted_fields(self, api_client, create_first_game):
+        omitted_fields = 'game_info,home_team_name_abbreviation,away_team_name_abbreviation'
+        response = api_client.get(reverse('game-list'), {'omit': omitted_fields})
+        assert response.status_code == status.HTTP_200_OK
+        assert not set(omitted_fields.split(',')) & set(response.data['results'][0])
+        assert response.data['results'][0]['id'] == create_first_game.id
 
     @pytest.mark.django_db
     def test_retrieve_game(self, api_client, create_first_game):
@@ -292,7 +429,7 @@ class TestStatsViewSet:
     def test_list_stats(self, api_client, create_first_statline, create_second_statline, create_third_statline):
         response = api_client.get(reverse('stats-list'))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        assert len(response.data['results']) == 3
 
     @pytest.mark.django_db
     def test_list_stats_specific_game(
@@ -307,11 +444,11 @@ class TestStatsViewSet:
         game_url = reverse('game-detail', args=[create_first_game.id])
         game_stats_url = f'{game_url}stats/'
         response = api_client.get(game_stats_url)
-        first_listed_player_id = int(response.data[0]['player'].split('/')[-2])
+        first_listed_player_id = int(response.data['results'][0]['player'].split('/')[-2])
         player_instance = Player.objects.get(pk=first_listed_player_id)
         player_instance_team = reverse('team-detail', args=[player_instance.team.id])
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
         assert player_instance_team == reverse('team-detail', args=[create_first_team.id])
 
     @pytest.mark.django_db
@@ -327,7 +464,29 @@ class TestStatsViewSet:
         player_stats_url = f'{player_url}stats/'
         response = api_client.get(player_stats_url)
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
+
+    @pytest.mark.django_db
+    def test_list_stats_constant_queries(
+            self,
+            api_client,
+            create_first_game,
+            create_first_player,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline,
+            django_assert_num_queries
+    ):
+        game_url = reverse('game-detail', args=[create_first_game.id])
+        player_url = reverse('player-detail', args=[create_first_player.id])
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse('stats-list'))
+        with django_assert_num_queries(1):
+            api_client.get(f'{game_url}stats/')
+        with django_assert_num_queries(1):
+            api_client.get(f'{player_url}stats/')
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 3
 
     @pytest.mark.django_db
     def test_retrieve_stats(self, api_client, create_first_statline):
@@ -443,3 +602,831 @@ class TestStatsViewSet:
         api_client.force_authenticate(user=create_superuser)
         response = api_client.delete(reverse('stats-detail', args=[create_first_statline.id]))
         assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+class TestLeaderboardViewSet:
+    @pytest.mark.django_db
+    def test_leaderboard_default_stat(
+            self,
+            api_client,
+            create_first_player,
+            create_second_player,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline
+    ):
+        response = api_client.get(reverse('leaderboard-list'))
+        assert response.status_code == status.HTTP_200_OK
+        assert [entry['player_id'] for entry in response.data] == [create_second_player.id, create_first_player.id]
+        assert [entry['rank'] for entry in response.data] == [1, 2]
+        assert response.data[0]['value'] == 14.0
+        assert response.data[0]['team_name_abbreviation'] == 'GSW'
+        assert response.data[1]['value'] == 12.5
+        assert response.data[1]['games_played'] == 2
+
+    @pytest.mark.django_db
+    def test_leaderboard_percentage_limit_and_min_games(
+            self,
+            api_client,
+            create_first_player,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline
+    ):
+        response = api_client.get(
+            reverse('leaderboard-list'),
+            {'stat': 'field_goal_percentage', 'limit': 1, 'min_games': 2}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 1
+        assert response.data[0]['player_id'] == create_first_player.id
+        assert response.data[0]['value'] == 57.14
+
+    @pytest.mark.django_db
+    def test_leaderboard_invalid_stat(self, api_client):
+        response = api_client.get(reverse('leaderboard-list'), {'stat': 'height'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'stat' in response.data
+
+    @pytest.mark.django_db
+    def test_leaderboard_cache_invalidated_on_stats_change(
+            self,
+            api_client,
+            create_first_statline,
+            django_capture_on_commit_callbacks
+    ):
+        first_response = api_client.get(reverse('leaderboard-list'))
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_statline.free_throws_made = 0
+            create_first_statline.save()
+        second_response = api_client.get(reverse('leaderboard-list'))
+        assert first_response.data[0]['value'] == 11.0
+        assert second_response.data[0]['value'] == 7.0
+
+
+class TestResponseCache:
+    @pytest.mark.django_db
+    def test_cached_list_served_from_cache(self, api_client, create_first_player, django_assert_num_queries):
+        first_response = api_client.get(reverse('player-list'))
+        with django_assert_num_queries(0):
+            second_response = api_client.get(reverse('player-list'))
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data == first_response.data
+
+    @pytest.mark.django_db
+    def test_cache_disabled_without_shared_backend(
+            self,
+            api_client,
+            create_first_player,
+            django_assert_num_queries,
+            settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        api_client.get(reverse('player-list'))
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse('player-list'))
+        assert response.status_code == status.HTTP_200_OK
+        assert [player['name'] for player in response.data['results']] == [create_first_player.name]
+
+    @pytest.mark.django_db
+    def test_stat_correction_only_invalidates_its_game(
+            self,
+            api_client,
+            create_first_statline,
+            create_third_statline,
+            django_assert_num_queries,
+            django_capture_on_commit_callbacks
+    ):
+        first_game_url = reverse('game-detail', args=[create_first_statline.game_id])
+        second_game_url = reverse('game-detail', args=[create_third_statline.game_id])
+        first_response = api_client.get(first_game_url)
+        api_client.get(second_game_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_statline.free_throws_made = 0
+            create_first_statline.save()
+
+        with django_assert_num_queries(1):
+            api_client.get(second_game_url)
+        second_response = api_client.get(first_game_url)
+        assert first_response.data['home_team_score'] == 11
+        assert second_response.data['home_team_score'] == 7
+
+    @pytest.mark.django_db
+    def test_player_move_invalidates_both_teams(
+            self,
+            api_client,
+            create_first_player,
+            create_second_team,
+            django_capture_on_commit_callbacks
+    ):
+        first_team_players_url = reverse('team-player-list', args=[create_first_player.team_id])
+        second_team_players_url = reverse('team-player-list', args=[create_second_team.id])
+        api_client.get(first_team_players_url)
+        api_client.get(second_team_players_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_player.team = create_second_team
+            create_first_player.save()
+
+        assert api_client.get(first_team_players_url).data['results'] == []
+        assert [player['name'] for player in api_client.get(second_team_players_url).data['results']] == [
+            create_first_player.name,
+        ]
+
+    @pytest.mark.django_db
+    def test_traded_player_stats_invalidate_current_team(
+            self,
+            api_client,
+            create_first_statline,
+            create_third_team,
+            django_capture_on_commit_callbacks
+    ):
+        player = create_first_statline.player
+        with django_capture_on_commit_callbacks(execute=True):
+            player.team = create_third_team
+            player.save()
+
+        team_players_url = reverse('team-player-list', args=[create_third_team.id])
+        first_response = api_client.get(team_players_url)
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_statline.delete()
+
+        second_response = api_client.get(team_players_url)
+        assert first_response.data['results'][0]['points_per_game'] == 11.0
+        assert second_response.data['results'][0]['points_per_game'] == 0.0
+
+
+class TestConditionalGet:
+    @pytest.mark.django_db
+    def test_detail_not_modified(self, api_client, create_first_player, django_assert_num_queries):
+        player_url = reverse('player-detail', args=[create_first_player.id])
+        first_response = api_client.get(player_url)
+        with django_assert_num_queries(1):
+            second_response = api_client.get(player_url, HTTP_IF_NONE_MATCH=first_response['ETag'])
+        assert first_response.status_code == status.HTTP_200_OK
+        assert first_response['Last-Modified']
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second_response['ETag'] == first_response['ETag']
+
+    @pytest.mark.django_db
+    def test_list_not_modified(self, api_client, create_first_statline, django_assert_num_queries):
+        stats_url = f'{reverse("game-detail", args=[create_first_statline.game_id])}stats/'
+        first_response = api_client.get(stats_url)
+        with django_assert_num_queries(0):
+            second_response = api_client.get(stats_url, HTTP_IF_NONE_MATCH=first_response['ETag'])
+        assert 'Last-Modified' not in first_response
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.django_db
+    def test_stats_write_changes_parent_etags(
+            self,
+            api_client,
+            create_first_statline,
+            create_second_player,
+            django_capture_on_commit_callbacks
+    ):
+        game_url = reverse('game-detail', args=[create_first_statline.game_id])
+        player_url = reverse('player-detail', args=[create_first_statline.player_id])
+        first_game_stats_response = api_client.get(f'{game_url}stats/')
+        first_player_response = api_client.get(player_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_statline.free_throws_made = 0
+            create_first_statline.save()
+
+        second_game_stats_response = api_client.get(
+            f'{game_url}stats/',
+            HTTP_IF_NONE_MATCH=first_game_stats_response['ETag'],
+        )
+        second_player_response = api_client.get(player_url, HTTP_IF_NONE_MATCH=first_player_response['ETag'])
+        assert second_game_stats_response.status_code == status.HTTP_200_OK
+        assert second_player_response.status_code == status.HTTP_200_OK
+        assert second_game_stats_response['ETag'] != first_game_stats_response['ETag']
+
+    @pytest.mark.django_db
+    def test_team_rename_changes_opponent_etag_without_shared_cache(
+            self,
+            api_client,
+            create_first_game,
+            django_capture_on_commit_callbacks,
+            settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        opponent_url = reverse('team-detail', args=[create_first_game.home_team_id])
+        first_response = api_client.get(opponent_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            renamed_team = create_first_game.away_team
+            renamed_team.name_abbreviation = 'GSX'
+            renamed_team.save()
+
+        second_response = api_client.get(opponent_url, HTTP_IF_NONE_MATCH=first_response['ETag'])
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data['games'][0]['info'].startswith('GSX @ MIA')
+
+    @pytest.mark.django_db
+    def test_team_delete_changes_member_etags(
+            self,
+            api_client,
+            create_first_player,
+            create_first_coach,
+            django_capture_on_commit_callbacks
+    ):
+        player_url = reverse('player-detail', args=[create_first_player.id])
+        coach_url = reverse('coach-detail', args=[create_first_coach.id])
+        first_player_response = api_client.get(player_url)
+        first_coach_response = api_client.get(coach_url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_player.team.delete()
+
+        second_player_response = api_client.get(player_url, HTTP_IF_NONE_MATCH=first_player_response['ETag'])
+        second_coach_response = api_client.get(coach_url, HTTP_IF_NONE_MATCH=first_coach_response['ETag'])
+        assert second_player_response.status_code == status.HTTP_200_OK
+        assert second_player_response.data['team'] is None
+        assert second_coach_response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.django_db
+    def test_list_etag_changes_on_delete(
+            self,
+            api_client,
+            create_first_player,
+            create_second_player,
+            django_capture_on_commit_callbacks
+    ):
+        first_response = api_client.get(reverse('player-list'))
+        with django_capture_on_commit_callbacks(execute=True):
+            create_first_player.delete()
+        second_response = api_client.get(reverse('player-list'), HTTP_IF_NONE_MATCH=first_response['ETag'])
+        third_response = api_client.get(reverse('player-list'), HTTP_IF_MODIFIED_SINCE=http_date())
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response['ETag'] != first_response['ETag']
+        assert third_response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.django_db
+    def test_list_validators_without_shared_cache(
+            self,
+            api_client,
+            create_first_player,
+            create_second_player,
+            settings
+    ):
+        settings.API_CACHE_ENABLED = False
+        first_response = api_client.get(reverse('player-list'))
+        second_response = api_client.get(reverse('player-list'), HTTP_IF_NONE_MATCH=first_response['ETag'])
+        create_first_player.delete()
+        third_response = api_client.get(reverse('player-list'), HTTP_IF_NONE_MATCH=first_response['ETag'])
+        assert 'Last-Modified' not in first_response
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert third_response.status_code == status.HTTP_200_OK
+
+
+class TestAsyncReads:
+    def test_read_routes_are_async(self):
+        assert iscoroutinefunction(resolve(reverse('team-list')).func)
+        assert iscoroutinefunction(resolve(reverse('stats-detail', args=[1])).func)
+        assert not iscoroutinefunction(resolve(reverse('game-box-score', args=[1])).func)
+        assert not iscoroutinefunction(resolve(reverse('coach-list')).func)
+
+    @pytest.mark.django_db
+    def test_async_list_teams_constant_queries(
+            self,
+            async_client,
+            create_first_coach,
+            create_first_player,
+            create_second_player,
+            create_first_game,
+            django_assert_num_queries
+    ):
+        with django_assert_num_queries(5):
+            response = async_to_sync(async_client.get)(reverse('team-list'))
+        first_team_data = next(
+            team_data for team_data in response.data['results'] if team_data['name_abbreviation'] == 'MIA'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert first_team_data['coach']['name'] == create_first_coach.name
+        assert [game_data['id'] for game_data in first_team_data['games']] == [create_first_game.id]
+
+    @pytest.mark.django_db
+    def test_async_retrieve_served_from_cache(self, async_client, create_first_player, django_assert_num_queries):
+        player_url = reverse('player-detail', args=[create_first_player.id])
+        first_response = async_to_sync(async_client.get)(player_url)
+        with django_assert_num_queries(1):
+            second_response = async_to_sync(async_client.get)(player_url)
+        assert first_response.status_code == status.HTTP_200_OK
+        assert second_response.data == first_response.data
+        assert second_response.data['name'] == create_first_player.name
+
+    @pytest.mark.django_db
+    def test_async_retrieve_missing(self, async_client):
+        response = async_to_sync(async_client.get)(reverse('game-detail', args=[404]))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.django_db
+    def test_async_detail_not_modified(self, async_client, create_first_statline):
+        stats_url = reverse('stats-detail', args=[create_first_statline.id])
+        first_response = async_to_sync(async_client.get)(stats_url)
+        second_response = async_to_sync(async_client.get)(stats_url, headers={'If-None-Match': first_response['ETag']})
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.django_db
+    def test_async_write_invalidates_reads(
+            self,
+            async_client,
+            create_superuser,
+            create_first_team,
+            django_capture_on_commit_callbacks
+    ):
+        async_client.force_login(create_superuser)
+        async_to_sync(async_client.get)(reverse('team-list'))
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            create_response = async_to_sync(async_client.post)(
+                reverse('team-list'),
+                {'name_abbreviation': 'ABC', 'full_name': 'Abcers'},
+                content_type='application/json',
+            )
+
+        list_response = async_to_sync(async_client.get)(reverse('team-list'))
+        assert create_response.status_code == status.HTTP_201_CREATED
+        assert callbacks
+        assert {team['name_abbreviation'] for team in list_response.data['results']} == {'MIA', 'ABC'}
+
+
+class TestAdvancedMetrics:
+    @pytest.mark.django_db
+    def test_player_advanced_metrics(
+            self,
+            api_client,
+            create_first_player,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline
+    ):
+        response = api_client.get(reverse('player-advanced', args=[create_first_player.id]))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['player_name'] == create_first_player.name
+        assert response.data['team_name_abbreviation'] == 'MIA'
+        assert response.data['games_played'] == 2
+        assert response.data['true_shooting_percentage'] == 71.35
+        assert response.data['player_efficiency_rating'] == 18.1
+
+    @pytest.mark.django_db
+    def test_player_advanced_metrics_missing_player(self, api_client):
+        response = api_client.get(reverse('player-advanced', args=[404]))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.django_db
+    def test_league_advanced_metrics(
+            self,
+            api_client,
+            create_first_player,
+            create_second_player,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline
+    ):
+        response = api_client.get(reverse('advanced-metrics-list'))
+        assert response.status_code == status.HTTP_200_OK
+        assert [entry['player_id'] for entry in response.data] == [create_first_player.id, create_second_player.id]
+        assert [entry['rank'] for entry in response.data] == [1, 2]
+
+    @pytest.mark.django_db
+    def test_league_advanced_metrics_stat_and_min_games(
+            self,
+            api_client,
+            create_first_player,
+            create_second_player,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline
+    ):
+        by_true_shooting = api_client.get(reverse('advanced-metrics-list'), {'stat': 'true_shooting_percentage'})
+        regulars = api_client.get(reverse('advanced-metrics-list'), {'stat': 'usage_rate', 'min_games': 2})
+        assert [entry['player_id'] for entry in by_true_shooting.data] == [
+            create_second_player.id,
+            create_first_player.id,
+        ]
+        assert [entry['player_id'] for entry in regulars.data] == [create_first_player.id]
+
+    @pytest.mark.django_db
+    def test_league_advanced_metrics_invalid_stat(self, api_client):
+        response = api_client.get(reverse('advanced-metrics-list'), {'stat': 'points'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestStandingsViewSet:
+    @pytest.mark.django_db
+    def test_standings(
+            self,
+            api_client,
+            create_first_statline,
+            create_second_statline,
+            create_third_statline,
+            django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse('standings-list'))
+        assert response.status_code == status.HTTP_200_OK
+        assert [entry['name_abbreviation'] for entry in response.data] == ['GSW', 'MIA', 'IND']
+        assert response.data[1]['wins'] == 1
+        assert response.data[1]['losses'] == 1
+        assert response.data[1]['win_percentage'] == 0.5
+        assert response.data[1]['games_behind'] == 0.5
+        assert response.data[1]['home_losses'] == 1
+        assert response.data[1]['away_wins'] == 1
+        assert response.data[1]['points_for'] == 25
+        assert response.data[1]['points_against'] == 14
+        assert response.data[1]['point_differential'] == 11
+        assert response.data[2]['games_behind'] == 1.0
+
+    @pytest.mark.django_db
+    def test_standings_ignore_games_without_score(self, api_client, create_first_game, create_second_game):
+        response = api_client.get(reverse('standings-list'))
+        assert response.status_code == status.HTTP_200_OK
+        assert all(entry['wins'] == 0 and entry['losses'] == 0 for entry in response.data)
+
+    @pytest.mark.django_db
+    def test_standings_follow_team_changes(
+            self,
+            api_client,
+            create_first_team,
+            create_second_team,
+            django_capture_on_commit_callbacks
+    ):
+        first_response = api_client.get(reverse('standings-list'))
+        with django_capture_on_commit_callbacks(execute=True):
+            new_team = Team.objects.create(name_abbreviation='BOS', full_name='Boston Celtics')
+        second_response = api_client.get(reverse('standings-list'))
+        with django_capture_on_commit_callbacks(execute=True):
+            create_second_team.delete()
+        third_response = api_client.get(reverse('standings-list'))
+        assert len(first_response.data) == 2
+        assert new_team.name_abbreviation in [entry['name_abbreviation'] for entry in second_response.data]
+        assert create_second_team.name_abbreviation not in [entry['name_abbreviation'] for entry in third_response.data]
+
+
+class TestGameLog:
+    @pytest.mark.django_db
+    def test_game_log_rolling_averages(self, api_client, create_first_player, create_second_team):
+        for day, free_throws_made in enumerate([6, 0, 12, 3, 9, 12], start=1):
+            game = Game.objects.create(
+                date=f'2024-01-{day:02d} 20:00:00',
+                home_team=create_first_player.team,
+                away_team=create_second_team,
+            )
+            Stats.objects.create(
+                game=game,
+                player=create_first_player,
+                field_goals_made=0,
+                field_goals_attempted=0,
+                three_pointers_made=0,
+                three_pointers_attempted=0,
+                free_throws_made=free_throws_made,
+                free_throws_attempted=free_throws_made,
+                defensive_rebounds=0,
+                offensive_rebounds=1,
+                assists=0,
+                steals=0,
+                blocks=0,
+                turnovers=0,
+            )
+
+        game_log_url = f'{reverse("player-detail", args=[create_first_player.id])}game-log/'
+        entries = []
+        next_url = f'{game_log_url}?page_size=4'
+        while next_url:
+            response = api_client.get(next_url)
+            assert response.status_code == status.HTTP_200_OK
+            entries.extend(response.data['results'])
+            next_url = response.data['next']
+
+        assert [entry['game_number'] for entry in entries] == [1, 2, 3, 4, 5, 6]
+        assert [entry['points'] for entry in entries] == [6, 0, 12, 3, 9, 12]
+        assert entries[0]['last_5']['points'] == 6.0
+        assert entries[5]['last_5']['points'] == 7.2
+        assert entries[5]['last_10']['points'] == 7.0
+        assert entries[4]['last_5']['points'] == 6.0
+        assert entries[3]['season_to_date']['points'] == 5.25
+        assert entries[5]['season_to_date']['rebounds'] == 1.0
+
+    @pytest.mark.django_db
+    def test_game_log_not_modified(self, api_client, create_first_statline):
+        game_log_url = f'{reverse("player-detail", args=[create_first_statline.player_id])}game-log/'
+        first_response = api_client.get(game_log_url)
+        second_response = api_client.get(game_log_url, HTTP_IF_NONE_MATCH=first_response['ETag'])
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.django_db
+    def test_game_log_not_found(self, api_client):
+        response = api_client.get(f'{reverse("player-detail", args=[1])}game-log/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestBoxScore:
+    @pytest.mark.django_db
+    def test_box_score(
+            self,
+            api_client,
+            create_first_statline,
+            create_second_statline,
+            django_assert_num_queries
+    ):
+        box_score_url = f'{reverse("game-detail", args=[create_first_statline.game_id])}box-score/'
+        with django_assert_num_queries(4):
+            response = api_client.get(box_score_url)
+        home_team = response.data['home_team']
+        away_team = response.data['away_team']
+        assert response.status_code == status.HTTP_200_OK
+        assert home_team['name_abbreviation'] == 'MIA'
+        assert home_team['score'] == 11
+        assert [line['player_name'] for line in home_team['players']] == [create_first_statline.player.name]
+        assert home_team['totals']['points'] == 11
+        assert home_team['totals']['field_goal_percentage'] == 37.5
+        assert away_team['name_abbreviation'] == 'GSW'
+        assert away_team['score'] == 14
+        assert away_team['totals']['rebounds'] == 2
+        assert away_team['totals']['field_goal_percentage'] == 83.33
+
+    @pytest.mark.django_db
+    def test_box_score_without_stats(self, api_client, create_first_game):
+        response = api_client.get(f'{reverse("game-detail", args=[create_first_game.id])}box-score/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['home_team']['players'] == []
+        assert response.data['away_team']['totals']['points'] == 0
+
+    @pytest.mark.django_db
+    def test_box_score_ignores_sparse_fieldsets(self, api_client, create_first_statline):
+        box_score_url = f'{reverse("game-detail", args=[create_first_statline.game_id])}box-score/'
+        response = api_client.get(box_score_url, {'fields': 'home_team', 'omit': 'points'})
+        home_team = response.data['home_team']
+        assert response.status_code == status.HTTP_200_OK
+        assert home_team['players'][0]['player_name'] == create_first_statline.player.name
+        assert home_team['players'][0]['points'] == 11
+        assert home_team['totals']['points'] == 11
+
+    @pytest.mark.django_db
+    def test_box_score_not_found(self, api_client):
+        response = api_client.get(f'{reverse("game-detail", args=[1])}box-score/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestBoxScoreBulkCreate:
+    @staticmethod
+    def statline(player, **overrides):
+        return {
+            'player': reverse('player-detail', args=[player.id]),
+            'field_goals_made': 3,
+            'field_goals_attempted': 8,
+            'three_pointers_made': 1,
+            'three_pointers_attempted': 4,
+            'free_throws_made': 4,
+            'free_throws_attempted': 4,
+            'defensive_rebounds': 8,
+            'offensive_rebounds': 5,
+            'assists': 1,
+            'steals': 0,
+            'blocks': 4,
+            'turnovers': 1,
+            **overrides,
+        }
+
+    @pytest.mark.django_db
+    def test_bulk_create_unauthenticated(self, api_client, create_first_game, create_first_player):
+        bulk_url = f'{reverse("game-detail", args=[create_first_game.id])}stats/bulk/'
+        response = api_client.post(bulk_url, [self.statline(create_first_player)], format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.django_db
+    def test_bulk_create_authenticated(
+            self,
+            api_client,
+            create_superuser,
+            create_first_game,
+            create_first_player,
+            create_second_player
+    ):
+        api_client.force_authenticate(user=create_superuser)
+        bulk_url = f'{reverse("game-detail", args=[create_first_game.id])}stats/bulk/'
+        data = [self.statline(create_first_player), self.statline(create_second_player, free_throws_made=0)]
+        response = api_client.post(bulk_url, data, format='json')
+        create_first_game.refresh_from_db()
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [statline['points'] for statline in response.data] == [11, 7]
+        assert response.data[0]['player_name'] == create_first_player.name
+        assert Stats.objects.filter(game=create_first_game).count() == 2
+        assert create_first_game.home_team_score == 11
+        assert create_first_game.away_team_score == 7
+        assert PlayerAverages.objects.get(player=create_second_player).points_total == 7
+
+    @pytest.mark.django_db
+    def test_bulk_create_per_row_errors(
+            self,
+            api_client,
+            create_superuser,
+            create_first_game,
+            create_first_player,
+            create_second_player,
+            create_third_player,
+            create_first_statline
+    ):
+        api_client.force_authenticate(user=create_superuser)
+        bulk_url = f'{reverse("game-detail", args=[create_first_game.id])}stats/bulk/'
+        data = [
+            self.statline(create_second_player),
+            self.statline(create_first_player),
+            self.statline(create_third_player),
+            self.statline(create_second_player),
+        ]
+        response = api_client.post(bulk_url, data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == [
+            {},
+            {'non_field_errors': ['Cannot have two instances of stats of the same player in one game.']},
+            {'non_field_errors': ['This player is not in the team participating in the game.']},
+            {'non_field_errors': ['Cannot have two instances of stats of the same player in one game.']},
+        ]
+        assert Stats.objects.filter(game=create_first_game).count() == 1
+
+    @pytest.mark.django_db
+    def test_bulk_create_field_errors(self, api_client, create_superuser, create_first_game, create_first_player):
+        api_client.force_authenticate(user=create_superuser)
+        bulk_url = f'{reverse("game-detail", args=[create_first_game.id])}stats/bulk/'
+        data = [
+            self.statline(create_first_player, field_goals_made=9),
+            self.statline(create_first_player, assists=-1),
+            {**self.statline(create_first_player), 'player': '/players/999/'},
+            {**self.statline(create_first_player), 'player': 'http://testserver/players/abc/'},
+        ]
+        response = api_client.post(bulk_url, data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {
+            'non_field_errors': ["The number of shots made can't be greater than the number of shots attempted."]
+        }
+        assert response.data[1] == {'assists': ['The number of assists has to be non-negative.']}
+        assert response.data[2] == {'player': ['Invalid hyperlink - Object does not exist.']}
+        assert response.data[3] == {'player': ['Invalid hyperlink - Object does not exist.']}
+
+
+class TestExportView:
+    @pytest.mark.django_db
+    def test_export_stats_csv(self, api_client, create_first_statline, create_second_statline):
+        response = api_client.get(reverse('export', args=['stats', 'csv']))
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'text/csv'
+        assert [int(row['id']) for row in rows] == [create_first_statline.id, create_second_statline.id]
+        assert rows[0]['player_name'] == 'Jimmy Butler'
+        assert rows[0]['points'] == '11'
+
+    @pytest.mark.django_db
+    def test_export_games_ndjson(self, api_client, create_first_statline, create_second_statline):
+        response = api_client.get(reverse('export', args=['games', 'ndjson']))
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert rows == [
+            {
+                'id': create_first_statline.game_id,
+                'date': '2024-01-01T00:00:00Z',
+                'home_team_id': create_first_statline.game.home_team_id,
+                'away_team_id': create_first_statline.game.away_team_id,
+                'home_team_score': 11,
+                'away_team_score': 14,
+                'home_team_name_abbreviation': 'MIA',
+                'away_team_name_abbreviation': 'GSW',
+            }
+        ]
+
+    @pytest.mark.django_db
+    def test_export_streams_asynchronously_under_asgi(self, async_client, create_first_player, create_second_player):
+        async def get_export():
+            response = await async_client.get(reverse('export', args=['players', 'ndjson']))
+            return response, b''.join([chunk async for chunk in response.streaming_content])
+
+        response, content = async_to_sync(get_export)()
+        assert response.is_async
+        assert [json.loads(line)['id'] for line in content.decode().splitlines()] == [
+            create_first_player.id,
+            create_second_player.id,
+        ]
+
+    @pytest.mark.django_db
+    def test_export_empty_table_has_header(self, api_client):
+        response = api_client.get(reverse('export', args=['players', 'csv']))
+        assert b''.join(response.streaming_content).decode().splitlines()[0].startswith('id,name,team_id')
+
+    @pytest.mark.django_db
+    def test_export_data_command(self, create_first_player, create_second_player):
+        output = io.StringIO()
+        call_command('export_data', 'players', '--format', 'ndjson', stdout=output)
+        assert [json.loads(line)['name'] for line in output.getvalue().splitlines()] == [
+            create_first_player.name,
+            create_second_player.name,
+        ]
+
+
+class TestScheduleCheck:
+    schedule_url = reverse('game-check-schedule')
+
+    @staticmethod
+    def scheduled_game(date, home_team, away_team):
+        return {
+            'date': date,
+            'home_team': reverse('team-detail', args=[home_team.id]),
+            'away_team': reverse('team-detail', args=[away_team.id]),
+        }
+
+    @pytest.mark.django_db
+    def test_schedule_check_unauthenticated(self, api_client, create_first_team, create_second_team):
+        data = {'games': [self.scheduled_game('2024-01-05 20:00', create_first_team, create_second_team)]}
+        response = api_client.post(self.schedule_url, data, format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.django_db
+    def test_schedule_check_valid(
+            self,
+            api_client,
+            create_superuser,
+            create_first_team,
+            create_second_team,
+            create_third_team,
+            create_first_game,
+            django_assert_num_queries
+    ):
+        api_client.force_authenticate(user=create_superuser)
+        data = {
+            'games': [
+                self.scheduled_game('2024-01-02 20:00', create_first_team, create_second_team),
+                self.scheduled_game('2024-01-03 20:00', create_second_team, create_third_team),
+            ]
+        }
+
+        with django_assert_num_queries(2):
+            response = api_client.post(self.schedule_url, data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'valid': True, 'conflicts': []}
+
+    @pytest.mark.django_db
+    def test_schedule_check_conflicts(
+            self,
+            api_client,
+            create_superuser,
+            create_first_team,
+            create_second_team,
+            create_third_team,
+            create_first_game
+    ):
+        api_client.force_authenticate(user=create_superuser)
+        data = {
+            'games': [
+                self.scheduled_game('2024-01-01 00:00', create_second_team, create_first_team),
+                self.scheduled_game('2024-01-01 01:30', create_third_team, create_first_team),
+                self.scheduled_game('2024-01-02 20:00', create_third_team, create_third_team),
+                self.scheduled_game('2024-01-03 20:00', create_second_team, create_third_team),
+                self.scheduled_game('2024-01-03 21:00', create_first_team, create_second_team),
+                self.scheduled_game('2024-01-05 20:00', create_first_team, create_second_team),
+            ]
+        }
+        response = api_client.post(self.schedule_url, data, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            'valid': False,
+            'conflicts': [
+                {'index': 0, 'error': 'Cannot have two games between the same teams at the same time.'},
+                {'index': 1, 'error': 'Away team has another game around the same time.'},
+                {'index': 2, 'error': 'Home team and Away team cannot be the same.'},
+                {'index': 3, 'error': 'Home team has another game around the same time.'},
+                {'index': 4, 'error': 'Away team has another game around the same time.'},
+            ],
+        }
+
+    @pytest.mark.django_db
+    def test_schedule_check_unknown_team(self, api_client, create_superuser, create_first_team):
+        api_client.force_authenticate(user=create_superuser)
+        data = {
+            'games': [{
+                'date': '2024-01-05 20:00',
+                'home_team': reverse('team-detail', args=[create_first_team.id]),
+                'away_team': reverse('team-detail', args=[create_first_team.id + 100]),
+            }]
+        }
+        response = api_client.post(self.schedule_url, data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data['games'][0]) == ['away_team']
+
+    @pytest.mark.django_db
+    def test_schedule_check_malformed_team_url(self, api_client, create_superuser, create_first_team):
+        api_client.force_authenticate(user=create_superuser)
+        data = {
+            'games': [{
+                'date': '2024-01-05 20:00',
+                'home_team': '/teams/x/',
+                'away_team': reverse('team-detail', args=[create_first_team.id]),
+            }]
+        }
+        response = api_client.post(self.schedule_url, data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['games'][0] == {'home_team': ['Invalid hyperlink - Object does not exist.']}
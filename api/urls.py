@@ -1,8 +1,9 @@
-from django.urls import path, include
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from api import views
+from api.exports import EXPORT_RESOURCES, EXPORT_FORMATS
 
 router = DefaultRouter()
 router.register(r'teams', views.TeamViewSet, basename='team')
@@ -10,6 +11,9 @@ router.register(r'coaches', views.CoachViewSet, basename='coach')
 router.register(r'players', views.PlayerViewSet, basename='player')
 router.register(r'games', views.GameViewSet, basename='game')
 router.register(r'stats', views.StatsViewSet, basename='stats')
+router.register(r'leaderboards', views.LeaderboardViewSet, basename='leaderboard')
+router.register(r'standings', views.StandingsViewSet, basename='standings')
+router.register(r'advanced-metrics', views.AdvancedMetricsViewSet, basename='advanced-metrics')
 
 teams_router = routers.NestedSimpleRouter(router, r'teams', lookup='team')
 teams_router.register(r'coach', views.CoachViewSet, basename='team-coach')
@@ -27,6 +31,11 @@ urlpatterns = [
     path('', include(teams_router.urls)),
     path('', include(games_router.urls)),
     path('', include(players_router.urls)),
+    re_path(
+        rf'^export/(?P<resource>{"|".join(EXPORT_RESOURCES)})\.(?P<export_format>{"|".join(EXPORT_FORMATS)})$',
+        views.ExportView.as_view(),
+        name='export',
+    ),
     path('schema/', SpectacularAPIView.as_view(), name='schema'),
     path('schema/docs/', SpectacularSwaggerView.as_view(url_name='schema')),
 ]
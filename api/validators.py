@@ -1,5 +1,9 @@
 from rest_framework import serializers
-from datetime import date
+from collections import defaultdict
+from datetime import date, timedelta
+
+
+SCHEDULE_CONFLICT_WINDOW = timedelta(hours=2)
 
 
 def validate_alpha_and_title(value, alpha_error, title_error, allowed_uppercase=[]):
@@ -58,3 +62,81 @@ def validate_title_or_number_start(value, error_message):
         for char in word[1:]:
             if char.isupper():
                 raise serializers.ValidationError(error_message)
+
+
+def validate_player_in_game(player, game):
+    if player.team_id != game.home_team_id and player.team_id != game.away_team_id:
+        raise serializers.ValidationError('This player is not in the team participating in the game.')
+
+
+def validate_shot_counts(data):
+    fgm = data['field_goals_made']
+    fga = data['field_goals_attempted']
+    tpm = data['three_pointers_made']
+    tpa = data['three_pointers_attempted']
+    ftm = data['free_throws_made']
+    fta = data['free_throws_attempted']
+
+    if fgm > fga or tpm > tpa or ftm > fta:
+        raise serializers.ValidationError(
+            "The number of shots made can't be greater than the number of shots attempted."
+        )
+
+    if tpa > fga:
+        raise serializers.ValidationError(
+            "The number of three pointers attempted can't be greater than the number of field goals attempted."
+        )
+
+    if tpm > fgm:
+        raise serializers.ValidationError(
+            "The number of three pointers made can't be greater than the number of field goals made."
+        )
+
+    return data
+
+
+def find_schedule_conflicts(games, existing_games=()):
+    errors = [None] * len(games)
+    matchups = defaultdict(int)
+    team_calendars = defaultdict(list)
+    home_conflicts = set()
+    away_conflicts = set()
+
+    for index, game in enumerate(games):
+        if game['home_team_id'] == game['away_team_id']:
+            errors[index] = 'Home team and Away team cannot be the same.'
+            continue
+
+        matchups[frozenset((game['home_team_id'], game['away_team_id'])), game['date']] += 1
+        team_calendars[game['home_team_id']].append((game['date'], index, home_conflicts))
+        team_calendars[game['away_team_id']].append((game['date'], index, away_conflicts))
+
+    for game in existing_games:
+        matchups[frozenset((game['home_team_id'], game['away_team_id'])), game['date']] += 1
+        team_calendars[game['home_team_id']].append((game['date'], None, None))
+        team_calendars[game['away_team_id']].append((game['date'], None, None))
+
+    for calendar in team_calendars.values():
+        calendar.sort(key=lambda entry: entry[0])
+        for (earlier_date, earlier_index, earlier_conflicts), (later_date, later_index, later_conflicts) in zip(
+            calendar,
+            calendar[1:],
+        ):
+            if later_date - earlier_date <= SCHEDULE_CONFLICT_WINDOW:
+                if earlier_index is not None:
+                    earlier_conflicts.add(earlier_index)
+                if later_index is not None:
+                    later_conflicts.add(later_index)
+
+    for index, game in enumerate(games):
+        if errors[index] is not None:
+            continue
+
+        if matchups[frozenset((game['home_team_id'], game['away_team_id'])), game['date']] > 1:
+            errors[index] = 'Cannot have two games between the same teams at the same time.'
+        elif index in home_conflicts:
+            errors[index] = 'Home team has another game around the same time.'
+        elif index in away_conflicts:
+            errors[index] = 'Away team has another game around the same time.'
+
+    return errors
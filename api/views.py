@@ -1,68 +1,618 @@
-from api.models import Team, Coach, Player, Game, Stats
-from api.serializers import TeamSerializer, CoachSerializer, PlayerSerializer, GameSerializer, StatsSerializer
+import functools
+import hashlib
+from api.advanced import get_advanced_metrics, get_player_advanced_metrics
+from api.cache import (
+    get_or_compute,
+    get_or_compute_response,
+    aget_or_compute_response,
+    get_resource_versions,
+    aget_resource_versions,
+)
+from api.exports import EXPORT_FORMATS, astream_export, stream_export
+from api.models import Team, Coach, Player, Game, Stats, PlayerAverages
+from api.serializers import (
+    TeamSerializer,
+    CoachSerializer,
+    PlayerSerializer,
+    GameSerializer,
+    StatsSerializer,
+    LeaderboardQuerySerializer,
+    LeaderboardEntrySerializer,
+    StandingsSerializer,
+    BoxScoreStatsSerializer,
+    ScheduleCheckSerializer,
+    ScheduleCheckResultSerializer,
+    BoxScoreSerializer,
+    GameLogEntrySerializer,
+    AdvancedMetricsQuerySerializer,
+    AdvancedMetricsSerializer,
+    AdvancedMetricsEntrySerializer,
+)
+from api.pagination import GameKeysetPagination, GameLogPagination
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import models, transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.db.models import Count, Max, Prefetch, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
 from rest_framework import viewsets
 from rest_framework import permissions
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 
-class TeamViewSet(viewsets.ModelViewSet):
+class SparseFieldsetsViewMixin:
+    def get_rendered_fields(self):
+        if not hasattr(self, '_rendered_fields'):
+            self._rendered_fields = set(self.get_serializer().fields)
+        return self._rendered_fields
+
+
+class CachedReadMixin:
+    cache_resource = None
+    cache_collection = None
+
+    def get_cache_resources(self):
+        lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        if lookup is not None:
+            return [f'{self.cache_resource}:{lookup}']
+
+        parent_resources = [
+            f'{kwarg.removesuffix("_pk")}:{value}' for kwarg, value in self.kwargs.items() if kwarg.endswith('_pk')
+        ]
+        return parent_resources or [self.cache_collection]
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        def compute_response_data():
+            return handler(request, *args, **kwargs).data
+
+        data = get_or_compute_response(self.get_cache_resources(), request.build_absolute_uri(), compute_response_data)
+        return Response(data)
+
+    async def aget_cached_response(self, handler, request, *args, **kwargs):
+        async def compute_response_data():
+            return (await handler(request, *args, **kwargs)).data
+
+        data = await aget_or_compute_response(
+            self.get_cache_resources(),
+            request.build_absolute_uri(),
+            compute_response_data,
+        )
+        return Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_cached_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.aget_cached_response(super().aretrieve, request, *args, **kwargs)
+
+
+class ConditionalGetMixin:
+    validator_aggregates = {'last_modified': Max('updated_at'), 'count': Count('pk')}
+
+    def get_validator_queryset(self, queryset=None):
+        if queryset is None:
+            queryset = self.filter_queryset(self.get_queryset())
+            lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+            if lookup is not None:
+                queryset = queryset.filter(**{self.lookup_field: lookup})
+        return queryset.order_by()
+
+    def build_validators(self, request, version, last_modified=None):
+        etag_source = f'{request.build_absolute_uri()}:{request.accepted_media_type}:{version}'
+        etag = quote_etag(hashlib.sha1(etag_source.encode()).hexdigest())
+        return etag, last_modified
+
+    def build_summary_validators(self, request, summary, detail):
+        last_modified = summary['last_modified']
+        if not detail:
+            version = f'{last_modified.isoformat() if last_modified else ""}:{summary["count"]}'
+            return self.build_validators(request, version)
+        if last_modified is None:
+            return None, None
+        return self.build_validators(request, last_modified.isoformat(), last_modified)
+
+    def build_version_validators(self, request, versions):
+        return self.build_validators(request, ':'.join(str(version) for version in versions))
+
+    def is_detail_validation(self, queryset):
+        return queryset is None and self.kwargs.get(self.lookup_url_kwarg or self.lookup_field) is not None
+
+    def uses_resource_versions(self, queryset):
+        return (
+            settings.API_CACHE_ENABLED
+            and isinstance(self, CachedReadMixin)
+            and not self.is_detail_validation(queryset)
+        )
+
+    def get_validators(self, request, queryset=None):
+        if self.uses_resource_versions(queryset):
+            return self.build_version_validators(request, get_resource_versions(self.get_cache_resources()))
+
+        summary = self.get_validator_queryset(queryset).aggregate(**self.validator_aggregates)
+        return self.build_summary_validators(request, summary, self.is_detail_validation(queryset))
+
+    async def aget_validators(self, request, queryset=None):
+        if self.uses_resource_versions(queryset):
+            return self.build_version_validators(request, await aget_resource_versions(self.get_cache_resources()))
+
+        summary = await self.get_validator_queryset(queryset).aaggregate(**self.validator_aggregates)
+        return self.build_summary_validators(request, summary, self.is_detail_validation(queryset))
+
+    def evaluate_validators(self, request, etag, last_modified):
+        validators = HttpResponse()
+        validators['ETag'] = etag
+        if last_modified is not None:
+            validators['Last-Modified'] = http_date(last_modified.timestamp())
+
+        conditional_response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified is not None else None,
+            response=validators,
+        )
+        return validators, None if conditional_response is validators else conditional_response
+
+    def set_validators(self, response, validators):
+        for header in ('ETag', 'Last-Modified'):
+            if header in validators:
+                response[header] = validators[header]
+        return response
+
+    def get_conditional_response(self, handler, request, *args, validator_queryset=None, **kwargs):
+        etag, last_modified = self.get_validators(request, validator_queryset)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        validators, conditional_response = self.evaluate_validators(request, etag, last_modified)
+        if conditional_response is not None:
+            return conditional_response
+
+        return self.set_validators(handler(request, *args, **kwargs), validators)
+
+    async def aget_conditional_response(self, handler, request, *args, validator_queryset=None, **kwargs):
+        etag, last_modified = await self.aget_validators(request, validator_queryset)
+        if etag is None:
+            return await handler(request, *args, **kwargs)
+
+        validators, conditional_response = self.evaluate_validators(request, etag, last_modified)
+        if conditional_response is not None:
+            return conditional_response
+
+        return self.set_validators(await handler(request, *args, **kwargs), validators)
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_conditional_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.aget_conditional_response(super().aretrieve, request, *args, **kwargs)
+
+
+class AsyncReadMixin:
+    async_actions = ('list', 'retrieve')
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if not cls.async_actions or not set(actions.values()).intersection(cls.async_actions):
+            return view
+
+        sync_view = sync_to_async(view)
+
+        async def async_view(request, *args, **kwargs):
+            method = 'get' if request.method == 'HEAD' else request.method.lower()
+            if actions.get(method) in cls.async_actions:
+                return await view(request, *args, **kwargs)
+            return await sync_view(request, *args, **kwargs)
+
+        return functools.update_wrapper(async_view, view)
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.action_map.get(request.method.lower()) in self.async_actions:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            response = await getattr(self, f'a{self.action}')(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            instance = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.paginator is None:
+            return Response(self.get_serializer([instance async for instance in queryset], many=True).data)
+
+        page = await sync_to_async(self.paginate_queryset)(queryset)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return Response(self.get_serializer(await self.aget_object()).data)
+
+
+class TeamViewSet(
+        ConditionalGetMixin,
+        CachedReadMixin,
+        AsyncReadMixin,
+        SparseFieldsetsViewMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_resource = 'team'
+    cache_collection = 'teams'
+
+    def get_queryset(self):
+        rendered_fields = self.get_rendered_fields()
+        teams = Team.objects.all()
+        if 'coach' in rendered_fields:
+            teams = teams.prefetch_related(Prefetch('coach', queryset=Coach.objects.order_by('pk')))
+        if 'players' in rendered_fields:
+            teams = teams.prefetch_related('players')
+        if 'games' in rendered_fields:
+            team_games = Game.objects.select_related('home_team', 'away_team')
+            teams = teams.prefetch_related(
+                Prefetch('home_games', queryset=team_games),
+                Prefetch('away_games', queryset=team_games),
+            )
+        return teams
 
 
-class CoachViewSet(viewsets.ModelViewSet):
+class CoachViewSet(ConditionalGetMixin, SparseFieldsetsViewMixin, viewsets.ModelViewSet):
     queryset = Coach.objects.all()
     serializer_class = CoachSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
         team_id = self.kwargs.get('team_pk')
+        coaches = Coach.objects.all()
+        if 'team_name_abbreviation' in self.get_rendered_fields():
+            coaches = coaches.select_related('team')
         if team_id:
-            return Coach.objects.filter(team_id=team_id)
+            return coaches.filter(team_id=team_id)
         else:
-            return Coach.objects.all()
+            return coaches
 
 
-class PlayerViewSet(viewsets.ModelViewSet):
+class PlayerViewSet(
+        ConditionalGetMixin,
+        CachedReadMixin,
+        AsyncReadMixin,
+        SparseFieldsetsViewMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Player.objects.all()
     serializer_class = PlayerSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_resource = 'player'
+    cache_collection = 'players'
 
     def get_queryset(self):
         team_id = self.kwargs.get('team_pk')
+        rendered_fields = self.get_rendered_fields()
+        players = Player.objects.all()
+        if 'team_name_abbreviation' in rendered_fields:
+            players = players.select_related('team')
+        if rendered_fields.intersection(PlayerSerializer.averages_fields):
+            players = players.select_related('averages')
         if team_id:
-            return Player.objects.filter(team_id=team_id)
+            return players.filter(team_id=team_id)
         else:
-            return Player.objects.all()
+            return players
+
+    @extend_schema(responses=GameLogEntrySerializer(many=True))
+    @action(detail=True, methods=['get'], url_path='game-log')
+    def game_log(self, request, *args, **kwargs):
+        def cached_game_log(request, *args, **kwargs):
+            return self.get_cached_response(self.compute_game_log, request, *args, **kwargs)
+
+        statlines = Stats.objects.filter(player_id=self.kwargs['pk'])
+        return self.get_conditional_response(
+            cached_game_log,
+            request,
+            *args,
+            validator_queryset=statlines,
+            **kwargs,
+        )
+
+    def compute_game_log(self, request, *args, **kwargs):
+        player = self.get_object()
+        game_log = player.stats.select_related('game__home_team', 'game__away_team').with_game_log()
+        paginator = GameLogPagination()
+        page = paginator.paginate_queryset(game_log, request, view=self)
+        serializer = GameLogEntrySerializer(page, many=True, context=self.get_serializer_context())
+        return paginator.get_paginated_response(serializer.data)
 
+    @extend_schema(responses=AdvancedMetricsSerializer)
+    @action(detail=True, methods=['get'])
+    def advanced(self, request, *args, **kwargs):
+        player = self.get_object()
+        advanced_metrics = {**get_player_advanced_metrics(player.pk), 'player': player}
+        return Response(AdvancedMetricsSerializer(advanced_metrics, context=self.get_serializer_context()).data)
 
-class GameViewSet(viewsets.ModelViewSet):
+
+class GameViewSet(
+        ConditionalGetMixin,
+        CachedReadMixin,
+        AsyncReadMixin,
+        SparseFieldsetsViewMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Game.objects.all()
     serializer_class = GameSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_resource = 'game'
+    cache_collection = 'games'
+    pagination_class = GameKeysetPagination
 
     def get_queryset(self):
         team_id = self.kwargs.get('team_pk')
+        rendered_fields = self.get_rendered_fields()
+        games = Game.objects.all()
+        if rendered_fields.intersection(['game_info', 'home_team_name_abbreviation']):
+            games = games.select_related('home_team')
+        if rendered_fields.intersection(['game_info', 'away_team_name_abbreviation']):
+            games = games.select_related('away_team')
         if team_id:
-            team_games = Game.objects.filter(away_team_id=team_id) | Game.objects.filter(home_team_id=team_id)
+            team_games = games.filter(Q(away_team_id=team_id) | Q(home_team_id=team_id))
             return team_games
         else:
-            return Game.objects.all()
+            return games
+
+    @extend_schema(request=BoxScoreStatsSerializer(many=True), responses={201: StatsSerializer(many=True)})
+    @action(detail=True, methods=['post'], url_path='stats/bulk')
+    def bulk_stats(self, request, pk=None):
+        game = self.get_object()
+        context = {**self.get_serializer_context(), 'game': game}
+        serializer = BoxScoreStatsSerializer(data=request.data, many=True, allow_empty=False, context=context)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            statlines = serializer.save()
+
+        return Response(StatsSerializer(statlines, many=True, context=context).data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(responses=BoxScoreSerializer)
+    @action(detail=True, methods=['get'], url_path='box-score')
+    def box_score(self, request, *args, **kwargs):
+        def cached_box_score(request, *args, **kwargs):
+            return self.get_cached_response(self.compute_box_score, request, *args, **kwargs)
+
+        return self.get_conditional_response(cached_box_score, request, *args, **kwargs)
 
+    def compute_box_score(self, request, *args, **kwargs):
+        game = self.get_object()
+        statlines = Stats.objects.filter(game=game).select_related('player').order_by('id')
+        team_totals = {
+            totals.pop('player__team'): Stats(**totals)
+            for totals in Stats.objects.filter(game=game).values('player__team').annotate(
+                **{stat_field: Sum(stat_field) for stat_field in Stats.STAT_FIELDS}
+            ).order_by()
+        }
 
-class StatsViewSet(viewsets.ModelViewSet):
+        def team_box_score(team, score):
+            return {
+                'team': team,
+                'score': score,
+                'players': [statline for statline in statlines if statline.player.team_id == team.id],
+                'totals': team_totals.get(team.id, Stats(**{stat_field: 0 for stat_field in Stats.STAT_FIELDS})),
+            }
+
+        box_score = {
+            'game': game,
+            'home_team': team_box_score(game.home_team, game.home_team_score),
+            'away_team': team_box_score(game.away_team, game.away_team_score),
+        }
+        return Response(BoxScoreSerializer(box_score, context=self.get_serializer_context()).data)
+
+    @extend_schema(request=ScheduleCheckSerializer, responses={200: ScheduleCheckResultSerializer})
+    @action(detail=False, methods=['post'], url_path='schedule/check')
+    def check_schedule(self, request):
+        serializer = ScheduleCheckSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        conflicts = serializer.get_conflicts()
+        return Response(ScheduleCheckResultSerializer({'valid': not conflicts, 'conflicts': conflicts}).data)
+
+
+class StatsViewSet(
+        ConditionalGetMixin,
+        CachedReadMixin,
+        AsyncReadMixin,
+        SparseFieldsetsViewMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Stats.objects.all()
     serializer_class = StatsSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_resource = 'stats'
+    cache_collection = 'stats'
 
     def get_queryset(self):
         game_id = self.kwargs.get('game_pk')
         player_id = self.kwargs.get('player_pk')
+        rendered_fields = self.get_rendered_fields()
+        stats = Stats.objects.all()
+        if 'game_info' in rendered_fields:
+            stats = stats.select_related('game__home_team', 'game__away_team')
+        if 'player_name' in rendered_fields:
+            stats = stats.select_related('player')
         if game_id:
-            game_stats = Stats.objects.filter(game_id=game_id).order_by('player__team')
+            game_stats = stats.filter(game_id=game_id).annotate(
+                player_team=Coalesce('player__team', 0, output_field=models.BigIntegerField())
+            ).order_by('player_team')
             return game_stats
         elif player_id:
-            game_stats = Stats.objects.filter(player_id=player_id)
+            game_stats = stats.filter(player_id=player_id)
             return game_stats
         else:
-            return Stats.objects.all()
+            return stats
+
+    def get_cursor_ordering(self):
+        if self.kwargs.get('game_pk'):
+            return ['player_team', 'id']
+        else:
+            return ['id']
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        serializer.save()
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        serializer.save()
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+
+
+class LeaderboardViewSet(viewsets.GenericViewSet):
+    serializer_class = LeaderboardEntrySerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = None
+
+    def get_queryset(self):
+        return PlayerAverages.objects.select_related('player__team')
+
+    @extend_schema(parameters=[LeaderboardQuerySerializer])
+    def list(self, request):
+        query_serializer = LeaderboardQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        stat = query_serializer.validated_data['stat']
+        limit = query_serializer.validated_data['limit']
+        min_games = query_serializer.validated_data['min_games']
+
+        def compute_leaderboard():
+            leaders = self.get_queryset().filter(games_played__gte=min_games).with_stat_value(stat).order_by(
+                '-stat_value',
+                'player_id',
+            )[:limit]
+            for rank, leader in enumerate(leaders, start=1):
+                leader.rank = rank
+            return self.get_serializer(leaders, many=True).data
+
+        cache_key = f'leaderboard:{request.build_absolute_uri("/")}:{stat}:{limit}:{min_games}'
+        return Response(get_or_compute(cache_key, compute_leaderboard))
+
+
+class AdvancedMetricsViewSet(viewsets.GenericViewSet):
+    serializer_class = AdvancedMetricsEntrySerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = None
+
+    def get_queryset(self):
+        return Player.objects.select_related('team')
+
+    @extend_schema(parameters=[AdvancedMetricsQuerySerializer])
+    def list(self, request):
+        query_serializer = AdvancedMetricsQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        stat = query_serializer.validated_data['stat']
+        limit = query_serializer.validated_data['limit']
+        min_games = query_serializer.validated_data['min_games']
+
+        def compute_advanced_metrics_leaders():
+            leaders = sorted(
+                (metrics for metrics in get_advanced_metrics().values() if metrics['games_played'] >= min_games),
+                key=lambda metrics: (-metrics[stat], metrics['player_id']),
+            )[:limit]
+            players = self.get_queryset().in_bulk([metrics['player_id'] for metrics in leaders])
+            entries = [
+                {**metrics, 'player': players[metrics['player_id']]}
+                for metrics in leaders
+                if metrics['player_id'] in players
+            ]
+            for rank, entry in enumerate(entries, start=1):
+                entry['rank'] = rank
+            return self.get_serializer(entries, many=True).data
+
+        cache_key = f'advanced-metrics:{request.build_absolute_uri("/")}:{stat}:{limit}:{min_games}'
+        return Response(get_or_compute(cache_key, compute_advanced_metrics_leaders))
+
+
+class StandingsViewSet(viewsets.GenericViewSet):
+    serializer_class = StandingsSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = None
+
+    def get_queryset(self):
+        return Team.objects.with_records()
+
+    def list(self, request):
+        def compute_standings():
+            teams = list(self.get_queryset())
+            for team in teams:
+                team.wins = team.home_wins + team.away_wins
+                team.losses = team.home_losses + team.away_losses
+                games_played = team.wins + team.losses
+                team.win_percentage = round(team.wins / games_played, 3) if games_played else 0.0
+                team.points_for = team.home_points_for + team.away_points_for
+                team.points_against = team.home_points_against + team.away_points_against
+                team.point_differential = team.points_for - team.points_against
+
+            teams.sort(key=lambda team: (-team.win_percentage, -team.point_differential, team.name_abbreviation))
+            leader = teams[0] if teams else None
+            for rank, team in enumerate(teams, start=1):
+                team.rank = rank
+                team.games_behind = ((leader.wins - team.wins) + (team.losses - leader.losses)) / 2
+
+            return self.get_serializer(teams, many=True).data
+
+        cache_key = f'standings:{request.build_absolute_uri("/")}'
+        return Response(get_or_compute(cache_key, compute_standings))
+
+
+class ExportView(APIView):
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    @extend_schema(responses={
+        (200, 'text/csv'): OpenApiTypes.STR,
+        (200, 'application/x-ndjson'): OpenApiTypes.STR,
+    })
+    def get(self, request, resource, export_format):
+        stream = astream_export if isinstance(request._request, ASGIRequest) else stream_export
+        response = StreamingHttpResponse(stream(resource, export_format), content_type=EXPORT_FORMATS[export_format])
+        response['Content-Disposition'] = f'attachment; filename="{resource}.{export_format}"'
+        return response
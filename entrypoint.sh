@@ -1,11 +1,9 @@
 #!/bin/bash
-echo "Create migrations"
-python manage.py makemigrations api
-echo "============================="
+set -e
 
-echo "Migrate"
-python manage.py migrate
-echo "============================="
+if [ "$#" -gt 0 ]; then
+    exec "$@"
+fi
 
 echo "Start server"
-python manage.py runserver --insecure 0.0.0.0:8000
+exec gunicorn --config gunicorn.conf.py
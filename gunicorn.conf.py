@@ -0,0 +1,35 @@
+import multiprocessing
+import os
+
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+wsgi_app = 'ownhoops.asgi:application' if 'uvicorn' in worker_class else 'ownhoops.wsgi:application'
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+threads = int(os.environ.get('GUNICORN_THREADS') or 4)
+
+connection_budget = int(os.environ.get('PG_CONNECTION_BUDGET') or 40)
+connections_per_worker = threads if 'uvicorn' not in worker_class else 1
+workers = int(
+    os.environ.get('WEB_CONCURRENCY')
+    or max(1, min(multiprocessing.cpu_count() * 2 + 1, connection_budget // connections_per_worker))
+)
+if workers * connections_per_worker > connection_budget:
+    raise RuntimeError(
+        f'{workers} workers with {connections_per_worker} connections each exceed PG_CONNECTION_BUDGET '
+        f'({connection_budget}); lower WEB_CONCURRENCY or GUNICORN_THREADS, or raise the budget'
+    )
+preload_app = True
+
+cache_backend = os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+if workers > 1 and cache_backend.endswith('LocMemCache') and os.environ.get('API_CACHE_ENABLED') == 'True':
+    raise RuntimeError('API_CACHE_ENABLED needs a shared CACHE_BACKEND when running more than one worker')
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT') or 30)
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT') or 30)
+keepalive = 5
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS') or 1000)
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+errorlog = '-'
@@ -30,6 +30,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -37,6 +38,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'ownhoops.urls'
@@ -104,6 +106,48 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetPagination',
+    'PAGE_SIZE': int(os.environ.get('PAGE_SIZE', 100)),
+}
+
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 500))
+
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 3600))
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    }
+}
+
+API_CACHE_ENABLED = os.environ.get(
+    'API_CACHE_ENABLED',
+    str(CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache'),
+) == 'True'
+
+DATABASE_ROUTERS = ['api.replicas.ReplicaRouter']
+DATABASE_REPLICAS = []
+REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED') == 'True'
+REQUEST_METRICS_QUERY_BUDGET = int(os.environ.get('REQUEST_METRICS_QUERY_BUDGET', 20))
+REQUEST_METRICS_TIME_BUDGET_MS = int(os.environ.get('REQUEST_METRICS_TIME_BUDGET_MS', 500))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'api': {
+            'handlers': ['console'],
+            'level': os.environ.get('API_LOG_LEVEL', 'INFO'),
+        },
+    },
 }
 
 SPECTACULAR_SETTINGS = {
@@ -12,5 +12,41 @@ DATABASES = {
         'PASSWORD': os.environ.get('PG_PASSWORD'),
         'HOST': os.environ.get('PG_HOST'),
         'PORT': os.environ.get('PG_PORT'),
+        'CONN_MAX_AGE': int(
+            os.environ.get('PG_CONN_MAX_AGE') or (0 if 'uvicorn' in os.environ.get('GUNICORN_WORKER_CLASS', '') else 60)
+        ),
+        'CONN_HEALTH_CHECKS': os.environ.get('PG_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('PG_DISABLE_SERVER_SIDE_CURSORS') == 'True',
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('PG_CONNECT_TIMEOUT', 5)),
+        },
     }
 }
+
+for index, replica in enumerate(filter(None, os.environ.get('PG_REPLICA_HOSTS', '').split(','))):
+    replica_host, _, replica_port = replica.strip().partition(':')
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'PORT': replica_port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica_')]
+
+
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+)
+
+STATIC_ROOT = BASE_DIR.parent / 'staticfiles'
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}